@@ -0,0 +1,5 @@
+"""
+AXON AI - Shared Neural Core
+Infrastructure shared by the Flask (app.py), FastAPI (main.py) and
+React API (backend/server.py) frontends.
+"""
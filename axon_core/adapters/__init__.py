@@ -0,0 +1,18 @@
+"""Thin framework adapters that wire identity, admission and the engine into Flask or FastAPI"""
+from typing import Any, Dict
+
+from axon_core.serializer import dumps
+
+JSON_MEDIA_TYPE = "application/json"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+# Keep proxies (nginx, Vercel) from buffering the token stream
+STREAM_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def json_body(reply) -> bytes:
+    """Encoded JSON for an EngineReply; pre-encoded bodies are sent as-is"""
+    return reply.body if reply.body is not None else dumps(reply.payload)
+
+
+def ndjson(event: Dict[str, Any]) -> bytes:
+    return dumps(event) + b"\n"
@@ -0,0 +1,203 @@
+"""FastAPI adapter: signed-session identity and admission middleware plus request/response mapping"""
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
+
+from fastapi import Form, Request, UploadFile
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from pydantic import BaseModel
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from axon_core.adapters import JSON_MEDIA_TYPE, NDJSON_MEDIA_TYPE, STREAM_HEADERS, json_body, ndjson
+from axon_core.admission import AdmissionRejected, RATE_LIMITED_PATHS, admit
+from axon_core.assets import AssetResponse
+from axon_core.engine import AskRequest, AxonEngine, EngineReply
+from axon_core.imageproxy import THUMB_MEDIA_TYPE, ProxiedImage
+from axon_core.identity import SESSION_COOKIE, SessionIdentity, cookie_kwargs, needs_session
+from axon_core.metrics import METRICS
+from axon_core.scheduler import DEADLINE_HEADER, deadline_from_header
+from axon_core.serializer import dumps
+from axon_core.uploads import MAX_REQUEST_BYTES, UploadTooLarge, read_upload
+
+
+class ImageBatch(BaseModel):
+    """Body of the gallery image-batch route"""
+    subjects: List[str] = []
+
+
+def too_many_requests(exc: AdmissionRejected) -> Response:
+    return Response(
+        dumps({"message": exc.message}),
+        status_code=429,
+        headers={"Retry-After": exc.retry_after_header},
+        media_type=JSON_MEDIA_TYPE,
+    )
+
+
+def payload_too_large(exc: UploadTooLarge) -> Response:
+    return Response(dumps({"message": exc.message}), status_code=413, media_type=JSON_MEDIA_TYPE)
+
+
+class BodyLimit:
+    """
+    Pure ASGI request-size guard, so oversized uploads are refused before
+    the multipart parser buffers them. A declared Content-Length over the cap
+    gets an immediate 413. A streamed body that crosses the cap mid-way gets
+    a 413 and a disconnect, which stops the parser reading further.
+    """
+
+    def __init__(self, app, max_bytes: int = MAX_REQUEST_BYTES):
+        self.app = app
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        length = dict(scope["headers"]).get(b"content-length", b"")
+        if length.isdigit() and int(length) > self.max_bytes:
+            METRICS.inc("upload.rejected.too_large")
+            return await payload_too_large(UploadTooLarge())(scope, receive, send)
+
+        received = 0
+        rejected = False
+
+        async def limited_receive():
+            nonlocal received, rejected
+            message = await receive()
+            if message["type"] == "http.request" and not rejected:
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    rejected = True
+                    METRICS.inc("upload.rejected.too_large")
+                    await payload_too_large(UploadTooLarge())(scope, receive, send)
+                    return {"type": "http.disconnect"}
+            return message
+
+        async def guarded_send(message):
+            if not rejected:  # the app's own (error) response is dropped once the 413 is out
+                await send(message)
+
+        await self.app(scope, limited_receive, guarded_send)
+
+
+def install_upload_limit(app) -> None:
+    """Request-size guard as the outermost layer plus a JSON 413 for per-file rejections"""
+    app.add_exception_handler(UploadTooLarge, lambda request, exc: payload_too_large(exc))
+    app.add_middleware(BodyLimit)
+
+
+def client_ip(request: Request) -> str:
+    return request.client.host if request.client else "unknown"
+
+
+class SessionLayers:
+    """
+    Pure ASGI front for the identity and admission middlewares. Sessionless
+    paths (landing page, assets, metrics) go straight to the app, skipping
+    both BaseHTTPMiddleware layers and their per-request task overhead.
+    """
+
+    def __init__(self, app, admission_control, session_identity):
+        self.app = app
+        # Identity is the outer layer so `request.state.user_id` is set before admission runs
+        self.layers = BaseHTTPMiddleware(BaseHTTPMiddleware(app, dispatch=admission_control), dispatch=session_identity)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and needs_session(scope["path"]):
+            await self.layers(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+
+def install_identity_and_admission(app, identity: SessionIdentity) -> None:
+    """Signed-cookie session identity plus per-user admission control on session routes"""
+
+    async def admission_control(request: Request, call_next):
+        if request.url.path in RATE_LIMITED_PATHS:
+            # Brand-new sessions are keyed on IP so dropping the cookie doesn't reset the bucket
+            sid = None if request.state.new_session else request.state.user_id
+            try:
+                admit(sid, client_ip(request))
+            except AdmissionRejected as e:
+                return too_many_requests(e)
+        return await call_next(request)
+
+    async def session_identity(request: Request, call_next):
+        sid, is_new = identity.resolve(request.cookies.get(SESSION_COOKIE))
+        request.state.user_id = sid
+        request.state.new_session = is_new
+        response = await call_next(request)
+        # A rejected request doesn't earn a session, so 429s can't be farmed for fresh cookies
+        if is_new and response.status_code != 429:
+            response.set_cookie(SESSION_COOKIE, identity.cookie_value(sid), **cookie_kwargs())
+        return response
+
+    app.add_middleware(SessionLayers, admission_control=admission_control, session_identity=session_identity)
+
+
+async def ask_request(request: Request, question: Optional[str], image: Optional[UploadFile]) -> AskRequest:
+    """Build an engine request from the parsed form fields (the image is streamed, capped and sniffed)"""
+    return AskRequest(
+        user_id=request.state.user_id,
+        question=question or "",
+        image=await asyncio.to_thread(read_upload, image.file, image.filename) if image else None,
+        client_ip=client_ip(request),
+        deadline=deadline_from_header(request.headers.get(DEADLINE_HEADER)),
+    )
+
+
+def to_response(reply: EngineReply) -> Response:
+    return Response(json_body(reply), status_code=reply.status, headers=reply.headers, media_type=JSON_MEDIA_TYPE)
+
+
+def to_image_response(result: Union[ProxiedImage, EngineReply]):
+    """Proxied thumbnail (or a 304 when the client's ETag still matches)"""
+    if isinstance(result, EngineReply):
+        return to_response(result)
+    if result.not_modified:
+        return Response(status_code=304, headers=result.headers)
+    return FileResponse(result.path, media_type=THUMB_MEDIA_TYPE, headers=result.headers)
+
+
+def to_asset_response(result: AssetResponse) -> Response:
+    """Pre-built static file or page body (already compressed for the client)"""
+    return Response(result.body, status_code=result.status, headers=result.headers, media_type=result.media_type)
+
+
+async def to_stream_response(events: AsyncIterator[Dict[str, Any]]):
+    """NDJSON streaming response; single-event replies fall back to plain JSON with their status"""
+    first = await events.__anext__()
+    if first["type"] == "done":
+        await events.aclose()
+        return to_response(AxonEngine.reply_from_done(first))
+
+    async def body():
+        try:
+            yield ndjson(first)
+            async for event in events:
+                yield ndjson(event)
+        finally:
+            await events.aclose()
+
+    return StreamingResponse(body(), media_type=NDJSON_MEDIA_TYPE, headers=STREAM_HEADERS)
+
+
+def register_routes(app, engine: AxonEngine, prefix: str = "") -> None:
+    """Routes every FastAPI server shares (draft prefetch, gallery batch, image proxy) under `prefix`"""
+
+    @app.post(f"{prefix}/prefetch")
+    async def prefetch(request: Request, question: Optional[str] = Form(None)):
+        """Debounced draft from the chat input; warms the live-search cache"""
+        return to_response(await engine.prefetch(
+            request.state.user_id, question or "", request.state.new_session, client_ip(request),
+        ))
+
+    @app.post(f"{prefix}/img-batch")
+    async def img_batch(request: Request, body: ImageBatch):
+        """Gallery fill: {"subjects": [...]} -> best image per subject in one round trip"""
+        reply = await engine.image_batch(body.subjects, deadline_from_header(request.headers.get(DEADLINE_HEADER)))
+        return to_response(reply)
+
+    @app.get(f"{prefix}/img-proxy")
+    async def img_proxy(request: Request, u: str = "", s: str = ""):
+        """WebP thumbnail of a signed /img result"""
+        return to_image_response(await engine.proxied_image(u, s, request.headers.get("if-none-match")))
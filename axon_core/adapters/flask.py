@@ -0,0 +1,190 @@
+"""Flask adapter: signed-session identity, admission control and a sync bridge to the async engine"""
+import asyncio
+import threading
+from typing import Any, AsyncIterator, Callable, Coroutine, Dict, Iterator, Optional, Union
+
+from flask import Response, g, request, send_file
+from werkzeug.exceptions import RequestEntityTooLarge
+
+from axon_core.adapters import JSON_MEDIA_TYPE, NDJSON_MEDIA_TYPE, STREAM_HEADERS, json_body, ndjson
+from axon_core.admission import AdmissionRejected, RATE_LIMITED_PATHS, admit
+from axon_core.assets import AssetResponse
+from axon_core.engine import AskRequest, AxonEngine, EngineReply
+from axon_core.imageproxy import THUMB_MEDIA_TYPE, ProxiedImage
+from axon_core.identity import SESSION_COOKIE, SessionIdentity, cookie_kwargs
+from axon_core.metrics import METRICS
+from axon_core.scheduler import DEADLINE_HEADER, deadline_from_header
+from axon_core.serializer import dumps
+from axon_core.uploads import MAX_REQUEST_BYTES, UploadTooLarge, read_upload
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def _engine_loop() -> asyncio.AbstractEventLoop:
+    """One background event loop per process that runs engine coroutines for WSGI workers"""
+    global _loop
+    if _loop is None:
+        with _loop_lock:
+            if _loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="axon-engine-loop", daemon=True).start()
+                _loop = loop
+    return _loop
+
+
+def run_sync(coro: Coroutine) -> Any:
+    """Block the calling WSGI thread until the coroutine finishes on the engine loop"""
+    return asyncio.run_coroutine_threadsafe(coro, _engine_loop()).result()
+
+
+def too_many_requests(exc: AdmissionRejected):
+    return Response(dumps({"message": exc.message}), status=429, mimetype=JSON_MEDIA_TYPE,
+                    headers={"Retry-After": exc.retry_after_header})
+
+
+def payload_too_large(exc: Exception):
+    if not isinstance(exc, UploadTooLarge):
+        # Werkzeug's early rejection; read_upload counts its own
+        METRICS.inc("upload.rejected.too_large")
+        exc = UploadTooLarge()
+    return Response(dumps({"message": exc.message}), status=413, mimetype=JSON_MEDIA_TYPE)
+
+
+def install_upload_limit(app) -> None:
+    """Werkzeug stops reading the body once it passes the cap; both failure modes become a JSON 413"""
+    app.config["MAX_CONTENT_LENGTH"] = MAX_REQUEST_BYTES
+    app.register_error_handler(RequestEntityTooLarge, payload_too_large)
+    app.register_error_handler(UploadTooLarge, payload_too_large)
+
+
+def install_identity(app, identity: SessionIdentity) -> Callable[[], str]:
+    """Register the signed axon_sid cookie hooks; returns `current_user_id`"""
+
+    def current_user_id() -> str:
+        """Session id from the signed cookie, minted on first sight"""
+        if "user_id" not in g:
+            g.user_id, g.new_session = identity.resolve(request.cookies.get(SESSION_COOKIE))
+        return g.user_id
+
+    @app.after_request
+    def issue_session_cookie(response):
+        # A rejected request doesn't earn a session, so 429s can't be farmed for fresh cookies
+        if g.get("new_session") and response.status_code != 429:
+            response.set_cookie(SESSION_COOKIE, identity.cookie_value(g.user_id), **cookie_kwargs())
+        return response
+
+    return current_user_id
+
+
+def install_admission(app, current_user_id: Callable[[], str]) -> None:
+    """Per-IP and per-user token buckets; fast 429 when over either limit"""
+
+    @app.before_request
+    def admission_control():
+        if request.path not in RATE_LIMITED_PATHS:
+            return None
+        # Brand-new sessions are keyed on IP so dropping the cookie doesn't reset the bucket
+        sid = current_user_id()
+        try:
+            admit(None if g.new_session else sid, request.remote_addr)
+        except AdmissionRejected as e:
+            return too_many_requests(e)
+        return None
+
+
+def ask_request(user_id: str) -> AskRequest:
+    """Build an engine request from the current multipart form (the image is streamed, capped and sniffed)"""
+    image_file = request.files.get("image")
+    return AskRequest(
+        user_id=user_id,
+        question=request.form.get("question", ""),
+        image=read_upload(image_file.stream, image_file.filename) if image_file else None,
+        client_ip=request.remote_addr or "unknown",
+        deadline=deadline_from_header(request.headers.get(DEADLINE_HEADER)),
+    )
+
+
+def to_response(reply: EngineReply):
+    return Response(json_body(reply), status=reply.status, mimetype=JSON_MEDIA_TYPE, headers=reply.headers)
+
+
+def to_image_response(result: Union[ProxiedImage, EngineReply]):
+    """Proxied thumbnail (or a 304 when the client's ETag still matches)"""
+    if isinstance(result, EngineReply):
+        return to_response(result)
+    if result.not_modified:
+        response = Response(status=304)
+    else:
+        response = send_file(result.path, mimetype=THUMB_MEDIA_TYPE, etag=False, conditional=False)
+    response.headers.update(result.headers)
+    return response
+
+
+def to_asset_response(result: AssetResponse):
+    """Pre-built static file or page body (already compressed for the client)"""
+    return Response(result.body, status=result.status, content_type=result.media_type, headers=result.headers)
+
+
+def iter_sync(events: AsyncIterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Drive an engine event stream from a WSGI thread, closing it if the client goes away"""
+    try:
+        while True:
+            try:
+                yield run_sync(events.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        run_sync(events.aclose())
+
+
+def to_stream_response(events: AsyncIterator[Dict[str, Any]]):
+    """
+    NDJSON response for an engine event stream. When the first event is
+    already the final one (commands, games, errors, 429s) a plain JSON
+    response with the real status is returned instead.
+    """
+    stream = iter_sync(events)
+    first = next(stream)
+    if first["type"] == "done":
+        stream.close()
+        return to_response(AxonEngine.reply_from_done(first))
+
+    def body():
+        # WSGI servers close this generator on disconnect; pass that on so the
+        # engine stream releases its stage slot, scheduler slot and Groq stream now
+        try:
+            yield ndjson(first)
+            for event in stream:
+                yield ndjson(event)
+        finally:
+            stream.close()
+
+    return Response(body(), mimetype=NDJSON_MEDIA_TYPE, headers=STREAM_HEADERS)
+
+
+def register_routes(app, engine: AxonEngine, current_user_id: Callable[[], str], prefix: str = "") -> None:
+    """Routes every Flask server shares (draft prefetch, gallery batch, image proxy) under `prefix`"""
+
+    @app.route(f"{prefix}/prefetch", methods=["POST"])
+    def prefetch():
+        """Debounced draft from the chat input; warms the live-search cache"""
+        user_id = current_user_id()
+        reply = run_sync(engine.prefetch(user_id, request.form.get("question", ""), g.new_session, request.remote_addr))
+        return to_response(reply)
+
+    @app.route(f"{prefix}/img-batch", methods=["POST"])
+    def img_batch():
+        """Gallery fill: {"subjects": [...]} -> best image per subject in one round trip"""
+        body = request.get_json(silent=True) or {}
+        subjects = body.get("subjects") if isinstance(body.get("subjects"), list) else []
+        reply = run_sync(engine.image_batch(subjects, deadline_from_header(request.headers.get(DEADLINE_HEADER))))
+        return to_response(reply)
+
+    @app.route(f"{prefix}/img-proxy", methods=["GET"])
+    def img_proxy():
+        """WebP thumbnail of a signed /img result"""
+        result = run_sync(engine.proxied_image(
+            request.args.get("u", ""), request.args.get("s", ""), request.headers.get("If-None-Match"),
+        ))
+        return to_image_response(result)
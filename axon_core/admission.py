@@ -0,0 +1,157 @@
+import os
+import math
+import time
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+from axon_core.metrics import METRICS
+
+RATE_LIMIT_PER_MINUTE = float(os.getenv("RATE_LIMIT_PER_MINUTE", 20))
+RATE_LIMIT_BURST = int(os.getenv("RATE_LIMIT_BURST", 10))
+RATE_LIMIT_MAX_KEYS = int(os.getenv("RATE_LIMIT_MAX_KEYS", 10000))
+# Looser per-address ceiling: sessions are free to mint, so one client
+# rotating cookies still shares a single IP bucket
+IP_RATE_LIMIT_PER_MINUTE = float(os.getenv("IP_RATE_LIMIT_PER_MINUTE", 60))
+IP_RATE_LIMIT_BURST = int(os.getenv("IP_RATE_LIMIT_BURST", 30))
+
+# Paths that spend Groq quota / worker time and are therefore rate limited
+RATE_LIMITED_PATHS = {"/ask", "/img-batch", "/api/chat", "/api/chat/stream", "/api/img-batch"}
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request is over its rate limit or a stage is saturated"""
+
+    def __init__(self, reason: str, retry_after: float):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+    @property
+    def retry_after_header(self) -> str:
+        return str(max(1, math.ceil(self.retry_after)))
+
+    @property
+    def message(self) -> str:
+        return f"Neural Link Overloaded: {self.reason}. Retry in {self.retry_after_header}s. ⏳"
+
+
+class TokenBucket:
+    """Classic token bucket: `rate` tokens/second refill up to `capacity`"""
+    __slots__ = ("rate", "capacity", "tokens", "updated")
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def try_acquire(self, cost: float = 1.0) -> float:
+        """Take `cost` tokens; return 0 on success or the seconds until enough refill"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= cost:
+            self.tokens -= cost
+            return 0.0
+        return (cost - self.tokens) / self.rate if self.rate > 0 else float("inf")
+
+
+class RateLimiter:
+    """Per-key token buckets, LRU-bounded so idle keys don't accumulate forever"""
+
+    def __init__(self, per_minute: float = RATE_LIMIT_PER_MINUTE, burst: int = RATE_LIMIT_BURST,
+                 max_keys: int = RATE_LIMIT_MAX_KEYS, name: str = "admission"):
+        self.name = name
+        self.rate = per_minute / 60.0
+        self.burst = burst
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def check(self, key: str, cost: float = 1.0) -> None:
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(self.rate, self.burst)
+                if len(self._buckets) > self.max_keys:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+            wait = bucket.try_acquire(cost)
+        if wait:
+            METRICS.inc(f"{self.name}.rejected.rate_limit")
+            raise AdmissionRejected("rate limit exceeded", wait)
+        METRICS.inc(f"{self.name}.admitted")
+
+
+class StageLimiter:
+    """Global cap on concurrent in-flight work for one expensive pipeline stage"""
+
+    def __init__(self, name: str, max_concurrent: int, retry_after: float = 2.0):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.retry_after = retry_after
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        METRICS.register_gauge(f"stage.{name}.in_flight", lambda: self._in_flight)
+
+    def acquire(self) -> None:
+        """Claim a slot without waiting, raising AdmissionRejected if the stage is full"""
+        with self._lock:
+            if self._in_flight >= self.max_concurrent:
+                METRICS.inc(f"admission.rejected.stage.{self.name}")
+                raise AdmissionRejected(f"{self.name} stage at capacity", self.retry_after)
+            self._in_flight += 1
+
+    def acquire_up_to(self, count: int) -> int:
+        """Claim up to `count` free slots without waiting; returns how many were claimed"""
+        with self._lock:
+            claimed = max(0, min(count, self.max_concurrent - self._in_flight))
+            self._in_flight += claimed
+            return claimed
+
+    def release(self, count: int = 1) -> None:
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - count)
+
+    @contextmanager
+    def slot(self):
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+
+# -------------------- SHARED LIMITERS --------------------
+USER_LIMITER = RateLimiter()
+IP_LIMITER = RateLimiter(IP_RATE_LIMIT_PER_MINUTE, IP_RATE_LIMIT_BURST, name="admission.ip")
+
+STAGES: Dict[str, StageLimiter] = {
+    "llm": StageLimiter("llm", int(os.getenv("LLM_MAX_CONCURRENCY", 8))),
+    "ocr": StageLimiter("ocr", int(os.getenv("OCR_MAX_CONCURRENCY", 2))),
+    "image_search": StageLimiter("image_search", int(os.getenv("IMAGE_SEARCH_MAX_CONCURRENCY", 4))),
+}
+
+
+def admission_key(session_id: Optional[str], client_ip: Optional[str]) -> str:
+    """
+    Key the user bucket on the session when the client presented one.
+    Cookie-less clients fall back to their IP, so dropping cookies
+    doesn't reset the bucket.
+    """
+    if session_id:
+        return f"sid:{session_id}"
+    return f"ip:{client_ip or 'unknown'}"
+
+
+def admit(session_id: Optional[str], client_ip: Optional[str]) -> None:
+    """
+    Charge the per-user bucket, then the per-IP ceiling; raises AdmissionRejected.
+    The user bucket goes first so one client hammering with a single cookie
+    doesn't drain the shared address bucket for its NAT neighbours.
+    """
+    USER_LIMITER.check(admission_key(session_id, client_ip))
+    IP_LIMITER.check(f"ip:{client_ip or 'unknown'}")
@@ -0,0 +1,204 @@
+"""
+Static asset pipeline for the template frontends (main.py, app.py).
+Every file under static/ is fingerprinted with a content hash and its
+gzip/brotli variants are compressed once, then kept in memory. index.html
+is pre-rendered with the fingerprinted URLs. Hashed URLs are served as
+immutable; the page and the original names are revalidated by ETag.
+
+    python -m axon_core.assets      # print the manifest and compression savings
+"""
+import os
+import re
+import gzip
+import hashlib
+import mimetypes
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+from axon_core.lazy import lazy_import, module_available
+from axon_core.metrics import METRICS
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STATIC_DIR = os.getenv("STATIC_DIR", os.path.join(ROOT_DIR, "static"))
+TEMPLATES_DIR = os.getenv("TEMPLATES_DIR", os.path.join(ROOT_DIR, "templates"))
+STATIC_PREFIX = "/static/"
+
+ASSET_COMPRESS_MIN_BYTES = int(os.getenv("ASSET_COMPRESS_MIN_BYTES", 1024))
+COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "image/svg+xml")
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+# Preferred first; brotli is optional
+ENCODINGS = ("br", "gzip")
+brotli = lazy_import("brotli")
+BROTLI_AVAILABLE = module_available("brotli")
+
+
+@dataclass
+class Asset:
+    """One file (or pre-rendered page) with its encoded variants"""
+    name: str
+    url: str
+    media_type: str
+    digest: str
+    variants: Dict[str, bytes] = field(default_factory=dict)  # "identity" / "gzip" / "br" -> body
+
+    def etag(self, encoding: str) -> str:
+        return f'"{self.digest}"' if encoding == "identity" else f'"{self.digest}-{encoding}"'
+
+    def select(self, accept_encoding: str) -> str:
+        accepted = parse_accept_encoding(accept_encoding)
+        for encoding in ENCODINGS:
+            if encoding in self.variants and (encoding in accepted or "*" in accepted):
+                return encoding
+        return "identity"
+
+
+@dataclass
+class AssetResponse:
+    status: int
+    body: bytes
+    media_type: str
+    headers: Dict[str, str]
+
+
+def parse_accept_encoding(header: str) -> Tuple[str, ...]:
+    """Encodings the client accepts (q=0 entries dropped)"""
+    accepted = []
+    for part in (header or "").lower().split(","):
+        name, _, params = part.strip().partition(";")
+        if not name:
+            continue
+        params = params.replace(" ", "")
+        if params.startswith("q="):
+            try:
+                if float(params[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.append(name.strip())
+    return tuple(accepted)
+
+
+def _compress(data: bytes, media_type: str) -> Dict[str, bytes]:
+    variants = {"identity": data}
+    if len(data) < ASSET_COMPRESS_MIN_BYTES or not media_type.startswith(COMPRESSIBLE_TYPES):
+        return variants
+    candidates = {"gzip": gzip.compress(data, compresslevel=9, mtime=0)}
+    if BROTLI_AVAILABLE:
+        candidates["br"] = brotli.compress(data, quality=11)
+    for encoding, body in candidates.items():
+        if len(body) < len(data):
+            variants[encoding] = body
+    return variants
+
+
+def _media_type(name: str) -> str:
+    media_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+    if media_type.startswith("text/") or media_type == "application/javascript":
+        media_type += "; charset=utf-8"
+    return media_type
+
+
+def _build(name: str, url: str, data: bytes, media_type: str) -> Asset:
+    digest = hashlib.sha256(data).hexdigest()[:16]
+    return Asset(name, url, media_type, digest, _compress(data, media_type))
+
+
+class AssetManifest:
+    """Fingerprinted static files plus pre-rendered pages, built once on first use"""
+
+    def __init__(self, static_dir: str = STATIC_DIR, templates_dir: str = TEMPLATES_DIR):
+        self.static_dir = static_dir
+        self.templates_dir = templates_dir
+        self._assets: Dict[str, Asset] = {}      # original name -> asset
+        self._hashed: Dict[str, Asset] = {}      # fingerprinted name -> asset
+        self._pages: Dict[str, Asset] = {}
+        self._built = False
+        self._lock = threading.Lock()
+        METRICS.register_gauge("assets.files", lambda: len(self._assets))
+
+    def _ensure(self) -> None:
+        if self._built:
+            return
+        with self._lock:
+            if self._built:
+                return
+            for dirpath, _, filenames in os.walk(self.static_dir):
+                for filename in filenames:
+                    path = os.path.join(dirpath, filename)
+                    name = os.path.relpath(path, self.static_dir).replace(os.sep, "/")
+                    with open(path, "rb") as f:
+                        data = f.read()
+                    asset = _build(name, "", data, _media_type(name))
+                    stem, ext = os.path.splitext(name)
+                    hashed = f"{stem}.{asset.digest[:10]}{ext}"
+                    asset.url = STATIC_PREFIX + hashed
+                    self._assets[name] = asset
+                    self._hashed[hashed] = asset
+            self._built = True
+
+    def url(self, name: str) -> str:
+        """Fingerprinted URL for a static file (the plain URL when unknown)"""
+        self._ensure()
+        asset = self._assets.get(name)
+        return asset.url if asset else STATIC_PREFIX + name
+
+    def rewrite(self, html: str) -> str:
+        """Point /static/<name> references at their fingerprinted URLs"""
+        return re.sub(r"/static/([\w./-]+)", lambda m: self.url(m.group(1)), html)
+
+    def page(self, template: str) -> Asset:
+        """A template pre-rendered once (static URLs rewritten) and compressed"""
+        asset = self._pages.get(template)
+        if asset is None:
+            with open(os.path.join(self.templates_dir, template), encoding="utf-8") as f:
+                html = self.rewrite(f.read())
+            asset = self._pages[template] = _build(template, "/", html.encode("utf-8"), "text/html; charset=utf-8")
+        return asset
+
+    def lookup(self, name: str) -> Tuple[Optional[Asset], bool]:
+        """(asset, immutable) for a path under /static/"""
+        self._ensure()
+        asset = self._hashed.get(name)
+        if asset is not None:
+            return asset, True
+        return self._assets.get(name), False
+
+    # -------------------- RESPONSES --------------------
+    @staticmethod
+    def respond(asset: Asset, immutable: bool, accept_encoding: str = "", if_none_match: str = "") -> AssetResponse:
+        encoding = asset.select(accept_encoding)
+        headers = {
+            "ETag": asset.etag(encoding),
+            "Cache-Control": IMMUTABLE_CACHE_CONTROL if immutable else REVALIDATE_CACHE_CONTROL,
+            "Vary": "Accept-Encoding",
+        }
+        if if_none_match and (if_none_match.strip() == "*" or f'"{asset.digest}' in if_none_match):
+            METRICS.inc("assets.not_modified")
+            return AssetResponse(304, b"", asset.media_type, headers)
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+        METRICS.inc(f"assets.served.{encoding}")
+        return AssetResponse(200, asset.variants[encoding], asset.media_type, headers)
+
+    def static(self, name: str, accept_encoding: str = "", if_none_match: str = "") -> AssetResponse:
+        asset, immutable = self.lookup(name)
+        if asset is None:
+            return AssetResponse(404, b"Not Found", "text/plain; charset=utf-8", {})
+        return self.respond(asset, immutable, accept_encoding, if_none_match)
+
+    def render(self, template: str, accept_encoding: str = "", if_none_match: str = "") -> AssetResponse:
+        return self.respond(self.page(template), False, accept_encoding, if_none_match)
+
+
+ASSETS = AssetManifest()
+
+
+if __name__ == "__main__":
+    ASSETS.page("index.html")
+    for asset in list(ASSETS._assets.values()) + list(ASSETS._pages.values()):
+        sizes = ", ".join(f"{enc} {len(body) / 1024:.1f} KB" for enc, body in asset.variants.items())
+        print(f"{asset.name:<16s} -> {asset.url:<36s} {sizes}")
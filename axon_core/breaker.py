@@ -0,0 +1,164 @@
+import os
+import time
+import threading
+from typing import Any, Callable, Dict
+
+from axon_core.metrics import METRICS
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Numeric codes so breaker state can be graphed as a gauge
+STATE_CODES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+FAILURE_THRESHOLD = int(os.getenv("BREAKER_FAILURE_THRESHOLD", 3))
+RECOVERY_SECONDS = float(os.getenv("BREAKER_RECOVERY_SECONDS", 60))
+
+
+def is_upstream_failure(exc: BaseException) -> bool:
+    """Client-side errors (4xx, e.g. a 429 on one model) don't mean the upstream is down"""
+    if not isinstance(exc, Exception):
+        # GeneratorExit / CancelledError: the caller went away mid-stream
+        return False
+    status = getattr(exc, "status_code", None)
+    return status is None or status >= 500
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is short-circuited because its upstream is failing"""
+
+    def __init__(self, name: str, retry_in: float):
+        super().__init__(f"{name} circuit open (retry in {retry_in:.0f}s)")
+        self.name = name
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """
+    Closed/open/half-open breaker for a single upstream dependency.
+    - CLOSED: calls pass through; consecutive failures are counted.
+    - OPEN: calls fail fast until `recovery_seconds` have elapsed.
+    - HALF_OPEN: a single probe call is let through; success closes the
+      circuit, failure re-opens it, and a probe abandoned by its caller
+      (cancelled, generator closed) leaves it half-open for the next one.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = FAILURE_THRESHOLD,
+                 recovery_seconds: float = RECOVERY_SECONDS,
+                 is_failure: Callable[[BaseException], bool] = is_upstream_failure):
+        self.name = name
+        self.is_failure = is_failure
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        METRICS.set_gauge(f"breaker.{name}.state", STATE_CODES[CLOSED])
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def _transition(self, state: str) -> None:
+        # Caller must hold the lock
+        if state == self._state:
+            return
+        self._state = state
+        METRICS.set_gauge(f"breaker.{self.name}.state", STATE_CODES[state])
+        METRICS.inc(f"breaker.{self.name}.transitions.{state}")
+        if state == OPEN:
+            self._opened_at = time.monotonic()
+
+    def allow(self) -> bool:
+        """Return True if a call may proceed right now"""
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._state == OPEN:
+                if time.monotonic() - self._opened_at < self.recovery_seconds:
+                    METRICS.inc(f"breaker.{self.name}.rejected")
+                    return False
+                self._transition(HALF_OPEN)
+            # HALF_OPEN: only one probe at a time
+            if self._probe_in_flight:
+                METRICS.inc(f"breaker.{self.name}.rejected")
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._probe_in_flight = False
+            self._transition(CLOSED)
+
+    def record_abandoned(self) -> None:
+        """The call never finished (cancelled or closed): free the probe, keep the state"""
+        METRICS.inc(f"breaker.{self.name}.abandoned")
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        METRICS.inc(f"breaker.{self.name}.failures")
+        with self._lock:
+            self._probe_in_flight = False
+            if self._state == HALF_OPEN:
+                self._transition(OPEN)
+                return
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                self._transition(OPEN)
+
+    def is_open(self) -> bool:
+        """True while cooling down, i.e. calls would be rejected without a probe"""
+        return self.retry_in() > 0
+
+    def retry_in(self) -> float:
+        with self._lock:
+            if self._state != OPEN:
+                return 0.0
+            return max(0.0, self.recovery_seconds - (time.monotonic() - self._opened_at))
+
+    def __enter__(self) -> "CircuitBreaker":
+        if not self.allow():
+            raise CircuitOpenError(self.name, self.retry_in())
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if exc is not None and not isinstance(exc, Exception):
+            # GeneratorExit / CancelledError / KeyboardInterrupt say nothing about the upstream
+            self.record_abandoned()
+        elif exc is None or not self.is_failure(exc):
+            self.record_success()
+        else:
+            self.record_failure()
+        return False
+
+    def call(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Invoke fn through the breaker, raising CircuitOpenError when open"""
+        with self:
+            return fn(*args, **kwargs)
+
+
+# -------------------- REGISTRY --------------------
+BREAKERS: Dict[str, CircuitBreaker] = {}
+_registry_lock = threading.Lock()
+
+
+def get_breaker(name: str, **kwargs) -> CircuitBreaker:
+    """Return the process-wide breaker for a dependency, creating it on first use"""
+    with _registry_lock:
+        if name not in BREAKERS:
+            BREAKERS[name] = CircuitBreaker(name, **kwargs)
+        return BREAKERS[name]
+
+
+def breaker_states() -> Dict[str, str]:
+    return {name: b.state for name, b in BREAKERS.items()}
+
+
+METRICS.register_gauge("breakers", breaker_states)
@@ -0,0 +1,80 @@
+"""
+Outbound requests to third-party URLs (proxied images, liveness probes).
+Connections are opened by a network backend that resolves the host itself,
+refuses loopback, private, link-local and other non-public addresses, and
+then connects to exactly the address it vetted. A host can't pass the
+check and rebind to an internal address for the real connection, and
+every redirect hop opens its connection through the same backend.
+"""
+import asyncio
+import ipaddress
+from typing import List
+
+from axon_core.metrics import METRICS
+from axon_core.upstream import httpcore, httpx
+
+
+class BlockedTarget(Exception):
+    """The URL's host is (or resolves to) a non-public address"""
+
+
+def is_public_address(address: str) -> bool:
+    ip = ipaddress.ip_address(address.split("%")[0])
+    ip = getattr(ip, "ipv4_mapped", None) or ip
+    return ip.is_global and not ip.is_multicast
+
+
+async def public_addresses(host: str, port: int) -> List[str]:
+    """Every address `host` resolves to, provided all of them are public"""
+    try:
+        addresses = [str(ipaddress.ip_address(host.strip("[]")))]
+    except ValueError:
+        try:
+            infos = await asyncio.get_running_loop().getaddrinfo(host, port)
+        except OSError as e:
+            raise httpcore.ConnectError(f"{host} does not resolve: {e}")
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+    if not addresses or not all(is_public_address(a) for a in addresses):
+        METRICS.inc("egress.blocked")
+        raise BlockedTarget(f"{host} points at a non-public address")
+    return addresses
+
+
+class PublicOnlyBackend:
+    """httpcore network backend that only connects to vetted public addresses"""
+
+    def __init__(self):
+        self._inner = httpcore.AnyIOBackend()
+
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        host = host.decode() if isinstance(host, bytes) else host
+        error = None
+        for address in await public_addresses(host, port):
+            try:
+                # TLS still uses the original hostname for SNI and certificate checks
+                return await self._inner.connect_tcp(address, port, timeout, local_address, socket_options)
+            except httpcore.ConnectError as e:
+                error = e
+        raise error
+
+    async def connect_unix_socket(self, path, timeout=None, socket_options=None):
+        raise BlockedTarget("unix sockets are not allowed")
+
+    async def sleep(self, seconds: float) -> None:
+        await self._inner.sleep(seconds)
+
+
+def public_client(limits=None, **kwargs) -> "httpx.AsyncClient":
+    """AsyncClient whose connections (redirect hops included) only reach public addresses"""
+    limits = limits or httpx.Limits()
+    transport = httpx.AsyncHTTPTransport(limits=limits)
+    # httpx has no public hook for the network backend, so swap in an equivalent pool that uses ours
+    transport._pool = httpcore.AsyncConnectionPool(
+        ssl_context=httpx.create_ssl_context(),
+        max_connections=limits.max_connections,
+        max_keepalive_connections=limits.max_keepalive_connections,
+        keepalive_expiry=limits.keepalive_expiry,
+        network_backend=PublicOnlyBackend(),
+    )
+    # No environment proxies: a proxy would make the connection on our behalf, unchecked
+    return httpx.AsyncClient(transport=transport, trust_env=False, **kwargs)
@@ -0,0 +1,698 @@
+"""
+AXON AI - Neural Engine
+Async-first request pipeline shared by every frontend. Servers build an
+AskRequest, await `AxonEngine.ask` and translate the EngineReply into their
+framework's response; per-frontend differences live in an EngineProfile.
+"""
+import os
+import time
+import json
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
+
+from axon_core import fragments, games, liveness, search, upstream, vision
+from axon_core.admission import AdmissionRejected, admission_key
+from axon_core.breaker import CircuitOpenError
+from axon_core.history import ASSISTANT, MEMORY_IDLE_SECONDS, USER, ConversationStore, Turn
+from axon_core.imageproxy import IMAGE_PROXY, IMAGE_PROXY_ENABLED, ProxiedImage, ProxyError
+from axon_core.intent import needs_live_data
+from axon_core.metrics import METRICS
+from axon_core.prefetch import SCHEDULED, SearchPrefetcher
+from axon_core.prompts import (
+    IMAGE_ANALYSIS_PROTOCOL, IMAGE_DESCRIPTION_PROMPT, IMAGE_KEYWORDS_BATCH_PROMPT, IMAGE_KEYWORDS_PROMPT, SUMMARY_PROMPT,
+    SystemPrompt,
+)
+from axon_core.responses import CLEAR_MESSAGE, CREATOR_INFO, basic_reply, command_reply, is_creator_query
+from axon_core.scheduler import (
+    BACKGROUND, IMAGE_SEARCH, INTERACTIVE, VISION, DeadlineExceeded, background_deadline,
+)
+from axon_core.subjects import DESCRIPTION, KEYWORDS, SUBJECT_CACHE
+from axon_core.uploads import ANALYSIS_CACHE, Upload
+
+TEXT_MODELS = ["llama-3.3-70b-versatile", "llama-3.1-8b-instant"]
+# 11B is often more available on free tiers than 90B
+VISION_MODELS = ["llama-3.2-11b-vision-preview", "llama-3.2-90b-vision-preview", "llama-3.3-70b-versatile"]
+HELPER_MODEL = "llama-3.1-8b-instant"
+
+IMG_TRIGGERS = ["/image", "/img", "give me an image of", "give me img", "show me a picture of", "show me an image of", "fetch me image of", "show me img", "search for an image of", "generate an image of"]
+IMG_FILLER = ["search", "for", "me", "find", "please", "of", "a", "an", "the"]
+DEFAULT_VISION_QUESTION = "Perform a comprehensive neural analysis of this visual data. Identify objects, analyze the scene, extract any visible text, and describe the overall context or mood."
+
+SUMMARIZE_AT = 20
+IMAGE_BATCH_MAX = int(os.getenv("IMAGE_BATCH_MAX", 8))
+
+
+@dataclass(frozen=True)
+class EngineProfile:
+    """Per-frontend presentation and memory settings"""
+    name: str
+    persona: str = "full"              # key into prompts.PERSONAS
+    include_location: bool = False     # add the client address to the system prompt
+    history_window: int = 10           # turns sent to the model
+    summary_keep: int = 10             # turns kept after summarization
+    history_ttl: Optional[float] = None  # seconds before a turn is forgotten
+    idle_ttl: float = MEMORY_IDLE_SECONDS  # seconds before an inactive user is dropped
+    voice_hints: bool = False          # append "Optional Voice Response" lines
+    image_results: str = "card"        # "card" (inline HTML) or "list" (urls in `images`)
+    image_protocol: bool = False       # short 1-2 line answers for image turns (IMAGE_ANALYSIS_PROTOCOL)
+    image_proxy_route: Optional[str] = None  # serve /img results through the thumbnail proxy
+    css_vars: bool = False             # theme colors via the page's CSS variables
+    http_errors: bool = False          # use 4xx/5xx statuses for failures
+    temperature: float = 0.2
+    max_tokens: int = 2048
+
+
+PROFILES: Dict[str, EngineProfile] = {
+    "fastapi": EngineProfile(
+        name="fastapi", persona="compact", include_location=True,
+        history_window=10, summary_keep=6, image_proxy_route="/img-proxy",
+    ),
+    "flask": EngineProfile(
+        name="flask", history_window=15, summary_keep=10, voice_hints=True,
+        css_vars=True, max_tokens=4096, image_proxy_route="/img-proxy",
+    ),
+    "backend": EngineProfile(
+        name="backend", history_window=10, summary_keep=10, history_ttl=600, idle_ttl=600,
+        image_results="list", image_protocol=True, image_proxy_route="/_/backend/api/img-proxy",
+        css_vars=True, http_errors=True, temperature=0.7,
+    ),
+}
+
+
+@dataclass
+class AskRequest:
+    user_id: str
+    question: str = ""
+    image: Optional[Upload] = None
+    client_ip: str = "unknown"
+    deadline: Optional[float] = None
+
+
+@dataclass
+class EngineReply:
+    payload: Dict[str, Any]
+    status: int = 200
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: Optional[bytes] = None  # pre-encoded JSON of `payload`, sent as-is by the adapters
+
+
+@dataclass
+class ChatTurn:
+    """A prepared model turn: prompt, history snapshot and image context"""
+    req: AskRequest
+    state: Dict[str, Any]
+    history: List[Turn]
+    question: str
+    messages: List[Dict[str, Any]]
+    context: Dict[str, str]
+    image_context: str = ""
+    image_mode: bool = False
+
+
+class CompletionFailed(Exception):
+    """Every model in the fallback chain failed (or a stream broke mid-answer)"""
+
+
+class AxonEngine:
+    """The full ask pipeline: commands, games, image search, vision and chat"""
+
+    def __init__(self, profile: EngineProfile):
+        self.profile = profile
+        self.prompt = SystemPrompt(profile.persona, profile.include_location)
+        self.store = ConversationStore(profile.name, profile.history_ttl, profile.idle_ttl)
+        self.memory = self.store.memory
+        self.store.start_sweeper()
+        self.prefetcher = SearchPrefetcher()
+        # Detached summarize+trim jobs; strong refs so the loop can't drop them mid-flight
+        self._summaries: Dict[str, asyncio.Task] = {}
+        METRICS.register_gauge(f"engine.{profile.name}.summaries_pending", lambda: len(self._summaries))
+
+    # -------------------- MEMORY --------------------
+    def reset(self, user_id: str) -> None:
+        self.store.reset(user_id)
+
+    def ensure(self, user_id: str) -> Dict[str, Any]:
+        return self.store.get(user_id)
+
+    # -------------------- REPLIES --------------------
+    def _reply(self, message: str, status: int = 200, **extra) -> EngineReply:
+        if not self.profile.http_errors:
+            status = 200
+        return EngineReply({"message": message, **extra}, status)
+
+    def _voice(self, message: str, spoken: str) -> str:
+        if self.profile.voice_hints:
+            return f"{message}<br><br>Optional Voice Response: {spoken}"
+        return message
+
+    def _static(self, message: str, action: str = "") -> EngineReply:
+        """Canned reply whose JSON body is encoded once per process"""
+        payload = {"message": message, "action": action} if action else {"message": message}
+        return EngineReply(payload, body=fragments.static_body(message, action))
+
+    def _board(self, game: Dict[str, Any]) -> str:
+        colors = ("var(--primary)", "var(--accent)") if self.profile.css_vars else fragments.DEFAULT_COLORS
+        return fragments.board(game["x"], game["o"], colors)
+
+    def _image_url(self, url: str) -> str:
+        if IMAGE_PROXY_ENABLED and self.profile.image_proxy_route:
+            return IMAGE_PROXY.url_for(url, self.profile.image_proxy_route)
+        return url
+
+    def _image_card(self, url: str, description: str) -> str:
+        border = "var(--glass-border)" if self.profile.css_vars else "rgba(255,255,255,0.1)"
+        text = "var(--text-main)" if self.profile.css_vars else "white"
+        return (
+            f"<div style='margin:15px 0; border-radius:20px; overflow:hidden; border:1px solid {border}; box-shadow:0 15px 35px rgba(0,0,0,0.5); background:rgba(0,0,0,0.2);'>"
+            f"  <img src='{url}' alt='{description}' style='width:100%; height:auto; display:block;' onerror=\"this.style.display='none';\">"
+            f"  <div style='padding:15px; background:rgba(0,0,0,0.4); backdrop-filter:blur(10px); color:{text}; font-size:14px; text-align:center; border-top:1px solid {border};'>{description}</div>"
+            f"</div>"
+            f"**Neural Scan Description:** {description}"
+        )
+
+    # -------------------- PIPELINE --------------------
+    def _error_reply(self, exc: Exception) -> EngineReply:
+        if isinstance(exc, AdmissionRejected):
+            return EngineReply({"message": exc.message}, 429, {"Retry-After": exc.retry_after_header})
+        if isinstance(exc, DeadlineExceeded):
+            return self._reply(f"Neural Link Timeout: {exc}", 503)
+        return self._reply(f"System Error: {str(exc)}", 500)
+
+    async def prefetch(self, user_id: str, draft: str, new_session: bool = False,
+                       client_ip: Optional[str] = None) -> EngineReply:
+        """Warm the live-search cache for a question the user is still typing"""
+        # Brand-new sessions are limited on IP, as on /ask, so cookieless drafts share one bucket
+        limit_key = admission_key(None if new_session else user_id, client_ip)
+        try:
+            status = await self.prefetcher.submit(user_id, draft, limit_key)
+        except AdmissionRejected as e:
+            return self._error_reply(e)
+        return EngineReply({"prefetch": status}, 202 if status == SCHEDULED else 200)
+
+    async def proxied_image(self, encoded: str, signature: str,
+                            if_none_match: Optional[str] = None) -> Union[ProxiedImage, EngineReply]:
+        """Thumbnail for a signed /img result reference"""
+        try:
+            return await IMAGE_PROXY.serve(encoded, signature, if_none_match)
+        except ProxyError as e:
+            return EngineReply({"message": e.message}, e.status)
+        except Exception as e:
+            print(f"Image Proxy Error: {e}")
+            return EngineReply({"message": "Image proxy failure"}, 502)
+
+    async def ask(self, req: AskRequest) -> EngineReply:
+        METRICS.inc(f"engine.{self.profile.name}.requests")
+        try:
+            step = await self._ask(req)
+            if isinstance(step, EngineReply):
+                return step
+            ai_message, last_error = await self._complete(step)
+            if not ai_message:
+                return self._reply(f"Neural Link Failure: {last_error}", 502)
+            return await self._finish(step, ai_message)
+        except Exception as e:
+            return self._error_reply(e)
+
+    @staticmethod
+    def done_event(reply: EngineReply) -> Dict[str, Any]:
+        event = {"type": "done", "status": reply.status, **reply.payload}
+        if reply.headers:
+            event["headers"] = reply.headers
+        if reply.body is not None:
+            event["encoded"] = reply.body
+        return event
+
+    @staticmethod
+    def reply_from_done(event: Dict[str, Any]) -> EngineReply:
+        payload = {k: v for k, v in event.items() if k not in ("type", "status", "headers", "encoded")}
+        return EngineReply(payload, event["status"], event.get("headers", {}), event.get("encoded"))
+
+    async def ask_stream(self, req: AskRequest) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Same pipeline as `ask`, as events: {"type": "delta", "content"} for
+        each model token chunk, then exactly one {"type": "done", "status", ...}
+        carrying the final payload. Commands and games emit only "done".
+        """
+        METRICS.inc(f"engine.{self.profile.name}.stream_requests")
+        parts: List[str] = []
+        try:
+            step = await self._ask(req)
+            if isinstance(step, EngineReply):
+                yield self.done_event(step)
+                return
+            async for delta in self._complete_stream(step):
+                parts.append(delta)
+                yield {"type": "delta", "content": delta}
+            reply = await self._finish(step, "".join(parts).strip())
+        except CompletionFailed as e:
+            if parts:
+                # Keep what already reached the user; the turn isn't remembered
+                reply = self._reply(f"{''.join(parts)}\n\n⚠️ Neural Link Failure: {e}", 502)
+            else:
+                reply = self._reply(f"Neural Link Failure: {e}", 502)
+        except Exception as e:
+            reply = self._error_reply(e)
+        yield self.done_event(reply)
+
+    async def _ask(self, req: AskRequest) -> Union[EngineReply, ChatTurn]:
+        """Answer commands, games and searches directly; otherwise prepare the model turn"""
+        question = (req.question or "").strip()
+        has_image = req.image is not None
+        if not question and not has_image:
+            return self._reply("Please provide text or image input.", 400)
+
+        if not upstream.GROQ_CONFIGURED:
+            return self._reply("Neural Link Unavailable: GROQ_API_KEY is not configured on the server. Please check the .env file.", 500)
+
+        q_lower = question.lower().strip()
+
+        # -------- AXON AI COMMANDS (HYBRID MODE) --------
+        if q_lower.startswith("/clear"):
+            self.reset(req.user_id)
+            return self._static(CLEAR_MESSAGE, action="clear")
+
+        canned = command_reply(q_lower) or basic_reply(q_lower)
+        if canned:
+            return self._static(canned)
+
+        if is_creator_query(question):
+            return self._static(CREATOR_INFO)
+
+        if q_lower.startswith("/video") or q_lower.startswith("/vid") or "show me a video for" in q_lower:
+            return await self._video(q_lower)
+
+        if any(trigger in q_lower for trigger in IMG_TRIGGERS):
+            return await self._image_search(q_lower, req.deadline)
+
+        if q_lower.startswith("open "):
+            app_name = question[5:].strip()
+            return self._reply(f"Opening {app_name.capitalize()}! 🛰️", action="open", target=app_name)
+
+        game_reply = self._games(req.user_id, question, q_lower)
+        if game_reply:
+            return game_reply
+
+        # -------- IMAGE HANDLING --------
+        image = None
+        if has_image:
+            if not req.image.mime_type:
+                return self._reply("Unsupported image format. Please upload a PNG, JPEG or WebP image.", 415)
+            image = await self._analyze_upload(req.image)
+            if not question:
+                question = DEFAULT_VISION_QUESTION
+
+        # -------- SECURITY BLOCK --------
+        if "gsk_" in question.lower() or "api key" in question.lower():
+            return self._reply("Access Denied: Security protocol active.")
+
+        return await self._prepare_chat(req, question, image)
+
+    async def _video(self, q_lower: str) -> EngineReply:
+        query = q_lower.replace("/video", "").replace("/vid", "").replace("show me a video for", "").strip()
+        for word in ["of ", "a ", "an "]:
+            if query.startswith(word): query = query[len(word):].strip()
+        if not query:
+            return self._reply("Please specify a topic. Example: /vid Python loops")
+        video = await asyncio.to_thread(search.video_search, query)
+        if video:
+            return self._reply(f"I found a tutorial for <strong>{query}</strong>:<br><br><strong>{video['title']}</strong><br>[Watch Video]({video['content']})<br><br>{video['description'][:150]}...")
+        return self._reply(f"I couldn't find a video for '<strong>{query}</strong>' right now. 😕")
+
+    async def _helper_prompt(self, system: str, query: str, max_tokens: int, deadline: Optional[float]) -> str:
+        res = await upstream.agroq_chat(
+            IMAGE_SEARCH, deadline,
+            model=HELPER_MODEL,
+            messages=[{"role": "system", "content": system}, {"role": "user", "content": query}],
+            max_tokens=max_tokens,
+        )
+        return res.choices[0].message.content.strip()
+
+    async def _subject_helper(self, kind: str, system: str, query: str, max_tokens: int,
+                              deadline: Optional[float]) -> str:
+        """Helper prompt output per subject, shared across users via the subject cache"""
+        cached = await SUBJECT_CACHE.aget(kind, query)
+        if cached is not None:
+            return cached
+        value = await self._helper_prompt(system, query, max_tokens, deadline)
+        if value:
+            await SUBJECT_CACHE.aput(kind, query, value)
+        return value
+
+    @staticmethod
+    def _fallback_keywords(query: str) -> str:
+        return f"{query} high quality official artwork pinterest"
+
+    async def _batch_keywords(self, subjects: List[str], deadline: Optional[float]) -> Dict[str, str]:
+        """Search keywords for many subjects: cache hits first, one structured Groq call for the rest"""
+        keywords = await SUBJECT_CACHE.aget_many(KEYWORDS, subjects)
+        missing = [s for s in subjects if s not in keywords]
+        if missing:
+            try:
+                res = await upstream.agroq_chat(
+                    IMAGE_SEARCH, deadline,
+                    model=HELPER_MODEL,
+                    messages=[
+                        {"role": "system", "content": IMAGE_KEYWORDS_BATCH_PROMPT},
+                        {"role": "user", "content": json.dumps(missing)},
+                    ],
+                    response_format={"type": "json_object"},
+                    max_tokens=30 * len(missing),
+                )
+                generated = json.loads(res.choices[0].message.content).get("keywords") or {}
+            except Exception as e:
+                print(f"Batch Keyword Error: {e}")
+                generated = {}
+            fresh = {}
+            for subject in missing:
+                value = generated.get(subject)
+                if isinstance(value, str) and value.strip():
+                    keywords[subject] = fresh[subject] = value.strip()
+                else:
+                    keywords[subject] = self._fallback_keywords(subject)
+            await SUBJECT_CACHE.aput_many(KEYWORDS, fresh)
+        return keywords
+
+    async def _gallery_image(self, keywords: str) -> Optional[str]:
+        try:
+            best_img = await liveness.best_live_image(await search.aimage_search(keywords))
+        except Exception as e:
+            print(f"Gallery Search Error: {e}")
+            return None
+        return self._image_url(best_img) if best_img else None
+
+    async def image_batch(self, subjects: List[str], deadline: Optional[float] = None) -> EngineReply:
+        """Best image per subject for a gallery, in one round trip"""
+        unique = list(dict.fromkeys(s.strip() for s in subjects if isinstance(s, str) and s.strip()))
+        if not unique:
+            return EngineReply({"message": "Provide a list of subjects."}, 400)
+        if len(unique) > IMAGE_BATCH_MAX:
+            return EngineReply({"message": f"At most {IMAGE_BATCH_MAX} subjects per batch."}, 400)
+        try:
+            with upstream.IMAGE_SEARCH_STAGE.slot():
+                keywords = await self._batch_keywords(unique, deadline)
+                # Each concurrent search holds a stage slot: the batch runs as wide as
+                # the free slots allow (at least the one it holds), never past the cap
+                extra = upstream.IMAGE_SEARCH_STAGE.acquire_up_to(len(unique) - 1)
+                try:
+                    width = asyncio.Semaphore(1 + extra)
+
+                    async def bounded(subject: str) -> Optional[str]:
+                        async with width:
+                            return await self._gallery_image(keywords[subject])
+
+                    images = await asyncio.gather(*(bounded(s) for s in unique))
+                finally:
+                    upstream.IMAGE_SEARCH_STAGE.release(extra)
+        except Exception as e:
+            return self._error_reply(e)
+        METRICS.inc("image_batch.subjects", len(unique))
+        return EngineReply({"results": [
+            {"subject": s, "keywords": keywords[s], "image": img} for s, img in zip(unique, images)
+        ]})
+
+    async def _image_search(self, q_lower: str, deadline: Optional[float]) -> EngineReply:
+        raw_query = q_lower
+        for trigger in IMG_TRIGGERS:
+            raw_query = raw_query.replace(trigger, "")
+        # Clean natural language filler
+        query = " ".join([w for w in raw_query.split() if w not in IMG_FILLER]).strip()
+        if not query:
+            return self._reply("Please specify a subject for the visual scan. Example: /img Neon cyberpunk city")
+
+        with upstream.IMAGE_SEARCH_STAGE.slot():
+            try:
+                try:
+                    optimized_query = await self._subject_helper(KEYWORDS, IMAGE_KEYWORDS_PROMPT, query, 20, deadline)
+                except Exception:
+                    optimized_query = self._fallback_keywords(query)
+
+                best_img = await liveness.best_live_image(await search.aimage_search(optimized_query))
+                if not best_img:
+                    return self._reply(f"My neural net couldn't locate a stable visual stream for '<strong>{query}</strong>'. Please try refining the subject parameters.")
+
+                if self.profile.image_results == "list":
+                    return self._reply(f"I've localized the most accurate visual for **{query}**.", images=[self._image_url(best_img)])
+
+                try:
+                    description = (await self._subject_helper(DESCRIPTION, IMAGE_DESCRIPTION_PROMPT, query, 50, deadline)).replace('"', "'")
+                except Exception:
+                    description = f"A high-definition visual of {query}, rendered with stunning detail."
+                return self._reply(self._voice(
+                    self._image_card(self._image_url(best_img), description),
+                    f"Neural scan complete. I've retrieved a high-fidelity visual of {query}. {description}",
+                ))
+            except Exception as e:
+                return self._reply(f"Neural Link Error: Visual processing logic encountered interference. (ID: {str(e)[:40]}...)")
+
+    # -------------------- MINI GAMES --------------------
+    def _games(self, user_id: str, question: str, q_lower: str) -> Optional[EngineReply]:
+        state = self.ensure(user_id)
+
+        if q_lower.startswith("/tictactoe") or "play tictactoe" in q_lower:
+            state["game_state"] = game = games.new_tictactoe(games.tictactoe_level(q_lower))
+            return self._reply(self._voice(
+                f"🤖 **Neural Challenge Accepted!** Let's play Tic-Tac-Toe! (difficulty: **{game['level']}**)<br><br>{self._board(game)}<br>Enter a position (**1-9**) to make your move.",
+                "Neural Challenge Accepted! Let's play Tic-Tac-Toe! It is your turn. Choose a position from 1 to 9.",
+            ))
+
+        if q_lower == "/guessnumber" or "play guess number" in q_lower:
+            state["game_state"] = games.new_guessnumber()
+            return self._reply(self._voice(
+                "🎯 I'm thinking of a number between <strong>1 and 100</strong>. Can you guess it?",
+                "I am thinking of a number between 1 and 100. Can you guess it?",
+            ))
+
+        game_state = state.get("game_state") or {}
+        if not question.isdigit():
+            return None
+
+        if game_state.get("game") == "tictactoe":
+            outcome, game = games.tictactoe_turn(game_state, int(question) - 1)
+            if outcome == games.INVALID:
+                return self._reply("⚠️ Invalid move. Please choose an empty slot from **1 to 9**.")
+            board_html = self._board(game)
+            if outcome == games.CONTINUE:
+                state["game_state"] = game
+                return self._reply(self._voice(
+                    f"My move! Board updated:<br><br>{board_html}<br>Your turn! Enter a position (**1-9**).",
+                    "My move. Board updated. Your turn! Enter a position from 1 to 9.",
+                ))
+            state["game_state"] = {}
+            if outcome == games.PLAYER_WINS:
+                return self._reply(self._voice(
+                    f"🎉 **Incredible!** You defeated me.<br><br>{board_html}<br>Neural processors recalibrating... You win!",
+                    "Incredible! You defeated me. Neural processors recalibrating. You win!",
+                ))
+            if outcome == games.AI_WINS:
+                return self._reply(self._voice(
+                    f"🤖 **Victory is mine!** Your strategy was logical, but my calculations were absolute.<br><br>{board_html}<br>Better luck next time.",
+                    "Victory is mine! Your strategy was logical, but my calculations were absolute. Better luck next time.",
+                ))
+            return self._reply(self._voice(
+                f"🤝 **Stalemate!** A perfect calculation on both sides.<br><br>{board_html}<br>It's a draw.",
+                "Stalemate! A perfect calculation on both sides. It is a draw.",
+            ))
+
+        if game_state.get("game") == "guessnumber":
+            guess = int(question)
+            game_state["attempts"] += 1
+            num, attempts = game_state["number"], game_state["attempts"]
+            if guess < num:
+                msg = self._voice(f"Higher! (Attempt {attempts})", f"Higher! Attempt {attempts}")
+            elif guess > num:
+                msg = self._voice(f"Lower! (Attempt {attempts})", f"Lower! Attempt {attempts}")
+            else:
+                msg = self._voice(
+                    f"🎊 <strong>Correct!</strong> The number was <strong>{num}</strong>. It took you {attempts} attempts. You have sharp intuition!",
+                    f"Correct! The number was {num}. It took you {attempts} attempts. You have sharp intuition!",
+                )
+                game_state = {}
+            state["game_state"] = game_state
+            return self._reply(msg)
+
+        return None
+
+    # -------------------- VISION --------------------
+    async def _analyze_upload(self, upload: Upload) -> Dict[str, str]:
+        """OCR + technical diagnostics + base64 encoding for an uploaded image (decoded in memory)"""
+        context = ANALYSIS_CACHE.get(upload.sha256)
+        if context is None:
+            with upstream.OCR_STAGE.slot():
+                # 1. Extract text using OCR (Tesseract)
+                context = await asyncio.to_thread(vision.extract_text_from_image, upload.image)
+
+                # 2. Run Technical Analysis (CV2/NumPy)
+                tech_summary = await asyncio.to_thread(
+                    lambda: vision.TechnicalImageAnalyzer(upload.image, upload.size).get_analysis_summary()
+                )
+                if tech_summary:
+                    context = f"{context}\n{tech_summary}"
+            if not upstream.TESSERACT_BREAKER.is_open():
+                ANALYSIS_CACHE.put(upload.sha256, context)
+        else:
+            METRICS.inc("upload.analysis_cache_hit")
+
+        # 3. Encode for Vision model
+        encoded = await asyncio.to_thread(vision.encode_image, upload.data)
+        return {"context": context, "base64": encoded, "mime_type": upload.mime_type}
+
+    # -------------------- CHAT --------------------
+    @staticmethod
+    def _turns(history: List[Turn]) -> List[Dict[str, Any]]:
+        # Timestamps are bookkeeping only; the model sees role/content
+        return [turn.as_message() for turn in history]
+
+    async def _prepare_chat(self, req: AskRequest, question: str, image: Optional[Dict[str, str]]) -> ChatTurn:
+        profile = self.profile
+        state = self.ensure(req.user_id)
+        # Vision -> text fallback replays up to 5 turns, so keep at least that many
+        chat_history = self.store.recent(req.user_id, state, max(profile.history_window, 5))
+        summary = str(state.get("summary", ""))
+
+        # -------- LIVE SEARCH --------
+        search_context = ""
+        if needs_live_data(question):
+            search_context = await asyncio.to_thread(search.cached_live_data, question)
+
+        # Stable persona prefix, then history, then the per-request context (date, summary, location)
+        context = self.prompt.context(summary, req.client_ip)
+        messages = [self.prompt.prefix]
+        messages.extend(self._turns(chat_history[-profile.history_window:]))
+        messages.append(context)
+
+        if search_context:
+            messages.append({"role": "system", "content": f"Real-time Context: {search_context}"})
+
+        image_context = image["context"] if image else ""
+        user_content = [{"type": "text", "text": question}]
+        if image:
+            if profile.image_protocol:
+                messages.append({"role": "system", "content": IMAGE_ANALYSIS_PROTOCOL})
+            # Technical/OCR context goes in a system hint so the user text stays focused
+            if image_context:
+                messages.append({"role": "system", "content": f"NEURAL IMAGE SENSOR DATA (DO NOT HALLUCINATE):\n{image_context}"})
+            user_content.append({"type": "image_url", "image_url": {"url": f"data:{image['mime_type']};base64,{image['base64']}"}})
+        messages.append({"role": "user", "content": user_content})
+
+        return ChatTurn(req, state, chat_history, question, messages, context, image_context, bool(image))
+
+    async def _finish(self, turn: ChatTurn, ai_message: str) -> EngineReply:
+        # -------- UPDATE HISTORY & SUMMARY --------
+        user_id, state = turn.req.user_id, turn.state
+        now = time.time()
+        length = self.store.append(
+            user_id, state,
+            Turn(USER, turn.question, now),
+            Turn(ASSISTANT, ai_message, now),
+        )
+
+        if length >= SUMMARIZE_AT and user_id not in self._summaries:
+            # BACKGROUND work must not hold the answer back: summarize after replying
+            task = asyncio.get_running_loop().create_task(self._compact(user_id, state))
+            self._summaries[user_id] = task
+            task.add_done_callback(lambda t: self._summary_done(user_id, t))
+        return self._reply(ai_message, image_context=turn.image_context or None)
+
+    async def _compact(self, user_id: str, state: Dict[str, Any]) -> None:
+        new_summary = await self._summarize(self.store.snapshot(user_id, state))
+        if new_summary:
+            state["summary"] = new_summary
+            self.store.trim(user_id, state, self.profile.summary_keep)
+
+    def _summary_done(self, user_id: str, task: asyncio.Task) -> None:
+        if self._summaries.get(user_id) is task:
+            del self._summaries[user_id]
+        if not task.cancelled() and task.exception() is not None:
+            METRICS.inc("engine.summaries.failed")
+            print(f"Summarization Error: {task.exception()}")
+
+    # -------------------- GROQ ENGINE CALL (MULTI-MODEL FALLBACK) --------------------
+    def _attempts(self, turn: ChatTurn) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """(model, messages) pairs in fallback order"""
+        for model_name in (VISION_MODELS if turn.image_mode else TEXT_MODELS):
+            current_messages = turn.messages
+            # Prevent hallucination during Vision -> Text fallback
+            if turn.image_mode and "vision" not in model_name:
+                cleaned_history = [h for h in self._turns(turn.history[-5:]) if isinstance(h.get("content"), str)]
+                current_messages = [self.prompt.prefix]
+                current_messages.extend(cleaned_history)
+                current_messages.extend((self.prompt.vision_fallback, turn.context))
+                current_messages.append({"role": "user", "content": f"TECHNICAL IMAGE CONTEXT:\n{turn.image_context}\n\nUSER QUESTION: {turn.question}"})
+            yield model_name, current_messages
+
+    @staticmethod
+    async def _try_next_model(model_name: str, error: Exception) -> bool:
+        """Retry strategy after a failed model call; True moves on to the next model"""
+        if isinstance(error, (CircuitOpenError, DeadlineExceeded)):
+            return False
+        last_error = str(error)
+        print(f"Neural Scan Error with {model_name}: {last_error}")
+        if "429" in last_error:
+            await asyncio.sleep(1.5)  # Neural cooldown on rate limits
+            return True
+        return any(code in last_error for code in ["400", "500", "503", "model_decommissioned"])
+
+    def _model_kwargs(self, model_name: str, messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {
+            "model": model_name,
+            "messages": messages,
+            "temperature": self.profile.temperature,
+            "max_tokens": self.profile.max_tokens,
+        }
+
+    async def _complete(self, turn: ChatTurn) -> Tuple[Optional[str], str]:
+        priority = VISION if turn.image_mode else INTERACTIVE
+        last_error = ""
+        with upstream.LLM_STAGE.slot():
+            for model_name, current_messages in self._attempts(turn):
+                try:
+                    res = await upstream.agroq_chat(priority, turn.req.deadline, **self._model_kwargs(model_name, current_messages))
+                    return res.choices[0].message.content.strip(), ""
+                except DeadlineExceeded:
+                    raise
+                except Exception as e:
+                    last_error = str(e)
+                    if not await self._try_next_model(model_name, e):
+                        break
+        return None, last_error
+
+    async def _complete_stream(self, turn: ChatTurn) -> AsyncIterator[str]:
+        """Token deltas from the first model that answers; falls back only before the first token"""
+        priority = VISION if turn.image_mode else INTERACTIVE
+        last_error = ""
+        with upstream.LLM_STAGE.slot():
+            for model_name, current_messages in self._attempts(turn):
+                started = False
+                try:
+                    async for delta in upstream.agroq_stream(priority, turn.req.deadline, **self._model_kwargs(model_name, current_messages)):
+                        started = True
+                        yield delta
+                    return
+                except DeadlineExceeded:
+                    raise
+                except Exception as e:
+                    last_error = str(e)
+                    if started:
+                        raise CompletionFailed(last_error) from e
+                    if not await self._try_next_model(model_name, e):
+                        break
+        raise CompletionFailed(last_error)
+
+    async def _summarize(self, history: List[Turn]) -> str:
+        """Summarize the conversation history to keep it compact"""
+        try:
+            formatted_history = "\n".join([f"{m.role}: {m.content[:200]}" for m in history])
+            response = await upstream.agroq_chat(
+                BACKGROUND, background_deadline(),
+                model=HELPER_MODEL,
+                messages=[
+                    {"role": "system", "content": SUMMARY_PROMPT},
+                    {"role": "user", "content": formatted_history},
+                ],
+                max_tokens=150,
+            )
+            return response.choices[0].message.content.strip()
+        except Exception as e:
+            print(f"Summarization Error: {e}")
+            return ""
@@ -0,0 +1,50 @@
+"""
+Precompiled response fragments.
+The Tic-Tac-Toe board frame and cells are built once; the full board HTML
+is memoized per (x, o, colors) position, and there are at most 3^9 boards.
+Canned replies are encoded to JSON bytes once and sent as-is.
+"""
+from functools import lru_cache
+from typing import Tuple
+
+from axon_core.metrics import METRICS
+from axon_core.responses import CREATOR_INFO, HELP_MESSAGE, INTRO_MESSAGE
+from axon_core.serializer import RawJSON, dumps
+
+DEFAULT_COLORS = ("#6366f1", "#10b981")
+BOARD_STATES = 3 ** 9
+
+BOARD_FRAME = (
+    "<div style='text-align:center; margin:15px 0;'><pre style='font-family: monospace; font-size: 1.3rem; line-height: 1.4; padding: 20px; background: rgba(0,0,0,0.3); border-radius: 15px; border: 1px solid rgba(255,255,255,0.1); display: inline-block;'>"
+    " {} | {} | {} \n---+---+---\n {} | {} | {} \n---+---+---\n {} | {} | {} </pre></div>"
+)
+EMPTY_CELLS = tuple(f"<span style='color:rgba(255,255,255,0.2); font-size: 0.9rem;'>{i + 1}</span>" for i in range(9))
+
+
+@lru_cache(maxsize=8)
+def _marks(colors: Tuple[str, str]) -> Tuple[str, str]:
+    return (f"<strong style='color:{colors[0]}'>X</strong>", f"<strong style='color:{colors[1]}'>O</strong>")
+
+
+@lru_cache(maxsize=2 * BOARD_STATES)
+def board(x: int, o: int, colors: Tuple[str, str] = DEFAULT_COLORS) -> str:
+    """HTML board for bitboards `x`/`o`; `colors` are the X and O marks (hex or CSS variables)"""
+    mark_x, mark_o = _marks(colors)
+    return BOARD_FRAME.format(*(
+        mark_x if x >> i & 1 else mark_o if o >> i & 1 else EMPTY_CELLS[i] for i in range(9)
+    ))
+
+
+@lru_cache(maxsize=256)
+def static_body(message: str, action: str = "") -> RawJSON:
+    """JSON body of a canned reply ({"message", optional "action"}), encoded once"""
+    return RawJSON(dumps({"message": message, "action": action} if action else {"message": message}))
+
+
+METRICS.register_gauge("fragments.board.hits", lambda: board.cache_info().hits)
+METRICS.register_gauge("fragments.board.entries", lambda: board.cache_info().currsize)
+METRICS.register_gauge("fragments.static.hits", lambda: static_body.cache_info().hits)
+
+# The long fixed bodies are encoded at import, not on the first request
+for _message in (HELP_MESSAGE, INTRO_MESSAGE, CREATOR_INFO):
+    static_body(_message)
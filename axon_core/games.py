@@ -0,0 +1,46 @@
+"""Mini-game logic (Tic-Tac-Toe, Guess the Number) shared by every frontend"""
+import random
+from typing import Any, Dict, Tuple
+
+from axon_core import tictactoe
+
+# Tic-Tac-Toe turn outcomes
+INVALID, PLAYER_WINS, AI_WINS, DRAW, CONTINUE = "invalid", "player_wins", "ai_wins", "draw", "continue"
+
+
+def new_tictactoe(level: str = tictactoe.DEFAULT_LEVEL) -> Dict[str, Any]:
+    """Player is X and moves first; the board is two bitboards"""
+    return {"game": "tictactoe", "x": 0, "o": 0, "level": level}
+
+
+def tictactoe_level(text: str) -> str:
+    """Difficulty named in a start command ("/tictactoe hard"), else the default"""
+    for level in tictactoe.LEVELS:
+        if level in text:
+            return level
+    return tictactoe.DEFAULT_LEVEL
+
+
+def new_guessnumber() -> Dict[str, Any]:
+    return {"game": "guessnumber", "number": random.randint(1, 100), "attempts": 0}
+
+
+def tictactoe_turn(game: Dict[str, Any], idx: int) -> Tuple[str, Dict[str, Any]]:
+    """Apply the player's move (0-8) and the AI reply; returns (outcome, game)"""
+    x, o = game["x"], game["o"]
+    bit = 1 << idx if 0 <= idx <= 8 else 0
+    if not bit or (x | o) & bit:
+        return INVALID, game
+    x |= bit
+    game = {**game, "x": x}
+    if tictactoe.has_line(x):
+        return PLAYER_WINS, game
+    move = tictactoe.choose_move(x, o, game["level"])
+    if move is not None:
+        o |= 1 << move
+        game["o"] = o
+    if tictactoe.has_line(o):
+        return AI_WINS, game
+    if (x | o) == tictactoe.FULL:
+        return DRAW, game
+    return CONTINUE, game
@@ -0,0 +1,266 @@
+"""
+Per-user conversation state with time-based expiry.
+Each user's turns live in a time-ordered deque, so expired turns pop off
+the left in amortized O(1). A global min-heap of per-user deadlines lets
+a background sweeper reclaim expired turns and idle users without
+walking every conversation.
+"""
+import os
+import sys
+import time
+import zlib
+import heapq
+import threading
+from collections import deque
+from itertools import islice
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from axon_core.memory import ShardedMemory
+from axon_core.metrics import METRICS
+
+MEMORY_IDLE_SECONDS = float(os.getenv("MEMORY_IDLE_SECONDS", 24 * 60 * 60))
+MEMORY_SWEEP_SECONDS = float(os.getenv("MEMORY_SWEEP_SECONDS", 30))
+MEMORY_SAMPLE_USERS = int(os.getenv("MEMORY_SAMPLE_USERS", 64))
+HISTORY_COMPRESS_BYTES = int(os.getenv("HISTORY_COMPRESS_BYTES", 1024))  # 0 disables compression
+HISTORY_COMPRESS_LEVEL = int(os.getenv("HISTORY_COMPRESS_LEVEL", 6))
+
+USER = "user"
+ASSISTANT = "assistant"
+
+
+# -------------------- COMPRESSION --------------------
+def _pack(text: str) -> Any:
+    """zlib-compress long bodies; short or incompressible ones stay plain str"""
+    if not HISTORY_COMPRESS_BYTES or len(text) < HISTORY_COMPRESS_BYTES:
+        return text
+    start = time.perf_counter()
+    raw = text.encode("utf-8")
+    packed = zlib.compress(raw, HISTORY_COMPRESS_LEVEL)
+    METRICS.inc("history.compress.seconds", time.perf_counter() - start)
+    if len(packed) >= len(raw):
+        return text
+    METRICS.inc("history.compress.bytes_in", len(raw))
+    METRICS.inc("history.compress.bytes_out", len(packed))
+    return packed
+
+
+def _unpack(body: Any) -> str:
+    if isinstance(body, str):
+        return body
+    start = time.perf_counter()
+    text = zlib.decompress(body).decode("utf-8")
+    METRICS.inc("history.decompress.seconds", time.perf_counter() - start)
+    return text
+
+
+def _compression_ratio() -> float:
+    bytes_out = METRICS.counter("history.compress.bytes_out")
+    return round(METRICS.counter("history.compress.bytes_in") / bytes_out, 2) if bytes_out else 1.0
+
+
+METRICS.register_gauge("history.compress.ratio", _compression_ratio)
+
+
+class Turn:
+    """
+    One stored chat message. Slotted with an interned role, so a turn costs
+    three pointers instead of a dict with three repeated string keys.
+    Long bodies are kept zlib-compressed and only inflated when read.
+    """
+
+    __slots__ = ("role", "_body", "timestamp")
+
+    def __init__(self, role: str, content: str, timestamp: float):
+        self.role = sys.intern(role)
+        self._body = _pack(content)
+        self.timestamp = timestamp
+
+    @property
+    def content(self) -> str:
+        return _unpack(self._body)
+
+    @property
+    def stored_size(self) -> int:
+        return sys.getsizeof(self._body)
+
+    def as_message(self) -> Dict[str, str]:
+        """Groq chat message shape; built only when a prompt is assembled"""
+        return {"role": self.role, "content": self.content}
+
+    def __repr__(self) -> str:
+        return f"Turn({self.role!r}, {self._body[:40]!r}, {self.timestamp})"
+
+
+def state_footprint(state: Dict[str, Any]) -> int:
+    """Approximate bytes held by one user's state (containers, turns and their text)"""
+    size = sys.getsizeof(state) + sys.getsizeof(state["summary"]) + sys.getsizeof(state["game_state"])
+    history = state["history"]
+    size += sys.getsizeof(history)
+    for turn in history:
+        size += sys.getsizeof(turn) + turn.stored_size
+    return size
+
+
+class ExpiryHeap:
+    """
+    Min-heap of (deadline, key). Entries are never removed in place;
+    the sweeper re-checks each popped key against its live state.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[float, str]] = []
+        self._lock = threading.Lock()
+
+    def schedule(self, key: str, at: float) -> None:
+        with self._lock:
+            heapq.heappush(self._heap, (at, key))
+
+    def pop_due(self, now: float) -> List[Tuple[float, str]]:
+        due = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                due.append(heapq.heappop(self._heap))
+        return due
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+class ConversationStore:
+    """
+    Sharded per-user state: {"history": deque, "summary", "game_state",
+    "last_seen", "expires_at"}. `history_ttl` expires individual turns,
+    `idle_ttl` drops users who stopped talking.
+    """
+
+    def __init__(self, name: str, history_ttl: Optional[float] = None,
+                 idle_ttl: float = MEMORY_IDLE_SECONDS):
+        self.name = name
+        self.history_ttl = history_ttl
+        self.idle_ttl = idle_ttl
+        self.memory = ShardedMemory()
+        self._expiry = ExpiryHeap()
+        self._sweeper: Optional[threading.Thread] = None
+        METRICS.register_gauge(f"memory.{name}.users", lambda: len(self.memory))
+        METRICS.register_gauge(f"memory.{name}.expiry_heap", lambda: len(self._expiry))
+        METRICS.register_gauge(f"memory.{name}.bytes_per_user", self.bytes_per_user)
+
+    # -------------------- STATE --------------------
+    def _fresh_state(self, now: float) -> Dict[str, Any]:
+        return {"history": deque(), "summary": "", "game_state": {}, "last_seen": now, "expires_at": now + self.idle_ttl}
+
+    def _schedule(self, user_id: str, state: Dict[str, Any], at: float) -> None:
+        # Only an earlier deadline needs a new heap entry; later ones are found on re-check
+        if at < state["expires_at"]:
+            state["expires_at"] = at
+            self._expiry.schedule(user_id, at)
+
+    def get(self, user_id: str) -> Dict[str, Any]:
+        """The user's state (created on first sight); counts as activity"""
+        now = time.time()
+        with self.memory.lock_for(user_id):
+            state = self.memory.get(user_id)
+            if state is None:
+                state = self.memory[user_id] = self._fresh_state(now)
+                self._expiry.schedule(user_id, state["expires_at"])
+            state["last_seen"] = now
+            return state
+
+    def reset(self, user_id: str) -> Dict[str, Any]:
+        now = time.time()
+        with self.memory.lock_for(user_id):
+            state = self.memory[user_id] = self._fresh_state(now)
+            self._expiry.schedule(user_id, state["expires_at"])
+            return state
+
+    def bytes_per_user(self, sample: int = MEMORY_SAMPLE_USERS) -> int:
+        """Mean state footprint over up to `sample` users (keeps /metrics cheap with many users)"""
+        sizes = []
+        for user_id in islice(iter(self.memory), sample):
+            with self.memory.lock_for(user_id):
+                state = self.memory.get(user_id)
+                if state is not None:
+                    sizes.append(state_footprint(state))
+        return sum(sizes) // len(sizes) if sizes else 0
+
+    # -------------------- HISTORY --------------------
+    def _prune(self, history: Deque[Turn], now: float) -> int:
+        """Drop expired turns from the left; they are time-ordered, so this stops at the first live one"""
+        if not self.history_ttl:
+            return 0
+        dropped = 0
+        cutoff = now - self.history_ttl
+        while history and history[0].timestamp <= cutoff:
+            history.popleft()
+            dropped += 1
+        if dropped:
+            METRICS.inc(f"memory.{self.name}.turns_expired", dropped)
+        return dropped
+
+    def recent(self, user_id: str, state: Dict[str, Any], n: int) -> List[Turn]:
+        """Live turns, newest `n` only; cost is bounded by `n` plus turns expired since last time"""
+        with self.memory.lock_for(user_id):
+            history = state["history"]
+            self._prune(history, time.time())
+            return list(islice(history, max(0, len(history) - n), None))
+
+    def append(self, user_id: str, state: Dict[str, Any], *turns: Turn) -> int:
+        """Append turns; returns the resulting history length"""
+        with self.memory.lock_for(user_id):
+            history = state["history"]
+            history.extend(turns)
+            if self.history_ttl and turns:
+                self._schedule(user_id, state, history[0].timestamp + self.history_ttl)
+            return len(history)
+
+    def snapshot(self, user_id: str, state: Dict[str, Any]) -> List[Turn]:
+        with self.memory.lock_for(user_id):
+            return list(state["history"])
+
+    def trim(self, user_id: str, state: Dict[str, Any], keep: int) -> None:
+        with self.memory.lock_for(user_id):
+            history = state["history"]
+            while len(history) > keep:
+                history.popleft()
+
+    # -------------------- BACKGROUND SWEEP --------------------
+    def _next_deadline(self, state: Dict[str, Any]) -> float:
+        at = state["last_seen"] + self.idle_ttl
+        history = state["history"]
+        if self.history_ttl and history:
+            at = min(at, history[0].timestamp + self.history_ttl)
+        return at
+
+    def sweep(self, now: Optional[float] = None) -> int:
+        """Expire due turns and reclaim idle users; returns the number of users dropped"""
+        now = time.time() if now is None else now
+        reclaimed = 0
+        for at, user_id in self._expiry.pop_due(now):
+            with self.memory.lock_for(user_id):
+                state = self.memory.get(user_id)
+                if state is None or at != state["expires_at"]:
+                    continue  # stale entry: user gone or rescheduled earlier
+                if state["last_seen"] + self.idle_ttl <= now:
+                    del self.memory[user_id]
+                    reclaimed += 1
+                    continue
+                self._prune(state["history"], now)
+                state["expires_at"] = self._next_deadline(state)
+                self._expiry.schedule(user_id, state["expires_at"])
+        if reclaimed:
+            METRICS.inc(f"memory.{self.name}.users_reclaimed", reclaimed)
+        return reclaimed
+
+    def start_sweeper(self, interval: float = MEMORY_SWEEP_SECONDS) -> threading.Thread:
+        if self._sweeper is None:
+            def _run():
+                while True:
+                    time.sleep(interval)
+                    try:
+                        self.sweep()
+                    except Exception as e:
+                        print(f"Memory Sweep Error: {e}")
+
+            self._sweeper = threading.Thread(target=_run, name=f"axon-sweeper-{self.name}", daemon=True)
+            self._sweeper.start()
+        return self._sweeper
@@ -0,0 +1,66 @@
+import os
+import hmac
+import base64
+import hashlib
+import secrets
+from typing import Optional, Tuple
+
+SESSION_COOKIE = "axon_sid"
+SESSION_MAX_AGE = int(os.getenv("SESSION_MAX_AGE", 30 * 24 * 3600))
+SESSION_COOKIE_SECURE = os.getenv("SESSION_COOKIE_SECURE", "0") == "1"
+
+# Routes that never touch per-user state: no cookie is verified or minted there,
+# so page loads, assets and crawlers don't create sessions (the first /ask does)
+SESSIONLESS_PATHS = frozenset({"/", "/metrics"})
+SESSIONLESS_PREFIXES = ("/static/",)
+
+
+class SessionIdentity:
+    """
+    Stateless session ids carried in an HMAC-signed cookie: "<sid>.<signature>".
+    Replaces keying per-user state on the client IP, which collapses every
+    user behind a NAT or proxy into a single bucket.
+    """
+
+    def __init__(self, secret: str):
+        self._key = hashlib.sha256(f"axon-session:{secret}".encode()).digest()
+
+    def _signature(self, sid: str) -> str:
+        digest = hmac.new(self._key, sid.encode(), hashlib.sha256).digest()[:16]
+        return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
+    def new_session_id(self) -> str:
+        return secrets.token_urlsafe(16)
+
+    def cookie_value(self, sid: str) -> str:
+        return f"{sid}.{self._signature(sid)}"
+
+    def verify(self, cookie: Optional[str]) -> Optional[str]:
+        """Return the session id if the cookie is well-formed and correctly signed"""
+        if not cookie or "." not in cookie:
+            return None
+        sid, _, sig = cookie.rpartition(".")
+        if not sid or not hmac.compare_digest(sig, self._signature(sid)):
+            return None
+        return sid
+
+    def resolve(self, cookie: Optional[str]) -> Tuple[str, bool]:
+        """Return (session_id, is_new); a fresh id is minted for missing/forged cookies"""
+        sid = self.verify(cookie)
+        if sid:
+            return sid, False
+        return self.new_session_id(), True
+
+
+def needs_session(path: str) -> bool:
+    return path not in SESSIONLESS_PATHS and not path.startswith(SESSIONLESS_PREFIXES)
+
+
+def cookie_kwargs() -> dict:
+    """Attributes shared by the Flask and Starlette set_cookie calls"""
+    return {
+        "max_age": SESSION_MAX_AGE,
+        "httponly": True,
+        "samesite": "Lax",
+        "secure": SESSION_COOKIE_SECURE,
+    }
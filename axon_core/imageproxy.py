@@ -0,0 +1,247 @@
+"""
+Signed image proxy for /img results.
+Third-party originals are fetched once, shrunk to a WebP thumbnail and
+kept in a size-bounded on-disk LRU, then served with a strong ETag and
+long-lived Cache-Control. Only URLs the engine signed can be proxied.
+"""
+import io
+import os
+import hmac
+import time
+import base64
+import asyncio
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+
+from axon_core.egress import BlockedTarget, public_client
+from axon_core.metrics import METRICS
+from axon_core.search import BING_HEADERS
+from axon_core.upstream import Image, httpx
+
+# Signing needs a private key: the servers' shipped fallback secret is public,
+# so without a configured one the proxy stays off and /img links the original
+PUBLIC_SECRETS = ("", "fallback_yash_axon_77")
+IMAGE_PROXY_SECRET = os.getenv("IMAGE_PROXY_SECRET") or os.getenv("SECRET_KEY") or os.getenv("FLASK_SECRET_KEY") or ""
+IMAGE_PROXY_ENABLED = os.getenv("IMAGE_PROXY_ENABLED", "1") == "1" and IMAGE_PROXY_SECRET not in PUBLIC_SECRETS
+IMAGE_CACHE_DIR = os.getenv("IMAGE_CACHE_DIR", os.path.join(tempfile.gettempdir(), "axon-image-cache"))
+IMAGE_CACHE_MAX_MB = float(os.getenv("IMAGE_CACHE_MAX_MB", 256))
+IMAGE_THUMB_WIDTH = int(os.getenv("IMAGE_THUMB_WIDTH", 960))
+IMAGE_THUMB_QUALITY = int(os.getenv("IMAGE_THUMB_QUALITY", 80))
+IMAGE_FETCH_MAX_BYTES = int(os.getenv("IMAGE_FETCH_MAX_BYTES", 15 * 1024 * 1024))
+IMAGE_FETCH_TIMEOUT = float(os.getenv("IMAGE_FETCH_TIMEOUT", 8))
+IMAGE_FETCH_MAX_REDIRECTS = 5
+
+THUMB_MEDIA_TYPE = "image/webp"
+THUMB_CACHE_CONTROL = "public, max-age=604800, immutable"
+
+
+class ProxyError(Exception):
+    """Proxy request that can't be served; carries the HTTP status"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+@dataclass
+class ProxiedImage:
+    path: str
+    etag: str
+    not_modified: bool = False
+
+    @property
+    def status(self) -> int:
+        return 304 if self.not_modified else 200
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {"ETag": self.etag, "Cache-Control": THUMB_CACHE_CONTROL}
+
+
+class ThumbnailCache:
+    """
+    On-disk LRU of WebP thumbnails bounded by total bytes. Files are named
+    "<key>.<etag>.webp" so the index can be rebuilt from a directory listing.
+    """
+
+    def __init__(self, directory: str = IMAGE_CACHE_DIR, max_bytes: int = int(IMAGE_CACHE_MAX_MB * 1024 * 1024)):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._index: "OrderedDict[str, Tuple[str, str, int]]" = OrderedDict()  # key -> (path, etag, size)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._load()
+        METRICS.register_gauge("image_cache.bytes", lambda: self._bytes)
+        METRICS.register_gauge("image_cache.entries", lambda: len(self._index))
+
+    def _load(self) -> None:
+        entries = []
+        for name in os.listdir(self.directory):
+            parts = name.split(".")
+            if len(parts) != 3 or parts[2] != "webp":
+                continue
+            path = os.path.join(self.directory, name)
+            stat = os.stat(path)
+            entries.append((stat.st_mtime, parts[0], path, f'"{parts[1]}"', stat.st_size))
+        for _, key, path, etag, size in sorted(entries):
+            self._index[key] = (path, etag, size)
+            self._bytes += size
+        self._evict()
+
+    def _evict(self) -> None:
+        while self._bytes > self.max_bytes and self._index:
+            _, (path, _, size) = self._index.popitem(last=False)
+            self._bytes -= size
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            METRICS.inc("image_cache.evicted")
+
+    def get(self, key: str) -> Optional[Tuple[str, str]]:
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None:
+                return None
+            if not os.path.exists(entry[0]):
+                # Removed behind our back (e.g. /tmp cleanup); rebuild on this request
+                del self._index[key]
+                self._bytes -= entry[2]
+                return None
+            self._index.move_to_end(key)
+            return entry[0], entry[1]
+
+    def put(self, key: str, data: bytes) -> Tuple[str, str]:
+        digest = hashlib.sha256(data).hexdigest()[:32]
+        path = os.path.join(self.directory, f"{key}.{digest}.webp")
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        etag = f'"{digest}"'
+        with self._lock:
+            old = self._index.pop(key, None)
+            if old is not None:
+                self._bytes -= old[2]
+                if old[0] != path:
+                    try:
+                        os.remove(old[0])
+                    except OSError:
+                        pass
+            self._index[key] = (path, etag, len(data))
+            self._bytes += len(data)
+            self._evict()
+        return path, etag
+
+
+class ImageProxy:
+    def __init__(self, secret: str = IMAGE_PROXY_SECRET, cache: Optional[ThumbnailCache] = None,
+                 width: int = IMAGE_THUMB_WIDTH):
+        self.enabled = secret not in PUBLIC_SECRETS
+        self._key = hashlib.sha256(f"axon-image-proxy:{secret}".encode()).digest()
+        self._cache = cache
+        self.width = width
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    @property
+    def cache(self) -> ThumbnailCache:
+        # Created on first use so importing the engine never touches the disk
+        if self._cache is None:
+            self._cache = ThumbnailCache()
+        return self._cache
+
+    # -------------------- SIGNED URLS --------------------
+    def _signature(self, url: str) -> str:
+        digest = hmac.new(self._key, url.encode(), hashlib.sha256).digest()[:16]
+        return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
+    def url_for(self, url: str, route: str) -> str:
+        """Proxy URL for `url` on the frontend's proxy route"""
+        encoded = base64.urlsafe_b64encode(url.encode()).rstrip(b"=").decode()
+        return f"{route}?{urlencode({'u': encoded, 's': self._signature(url)})}"
+
+    def verify(self, encoded: str, signature: str) -> str:
+        if not self.enabled:
+            raise ProxyError(404, "Image proxy is not configured")
+        try:
+            url = base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4)).decode()
+        except ValueError:
+            raise ProxyError(400, "Malformed image reference")
+        if not url.startswith(("http://", "https://")) or not hmac.compare_digest(signature, self._signature(url)):
+            raise ProxyError(403, "Image reference signature mismatch")
+        return url
+
+    # -------------------- FETCH + THUMBNAIL --------------------
+    async def _fetch(self, url: str) -> bytes:
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ProxyError(403, "Image reference is not a public http(s) URL")
+        # Every hop, redirects included, connects only to a vetted public address
+        try:
+            async with public_client(headers=BING_HEADERS, timeout=IMAGE_FETCH_TIMEOUT,
+                                     follow_redirects=True, max_redirects=IMAGE_FETCH_MAX_REDIRECTS) as http:
+                async with http.stream("GET", url) as response:
+                    if response.status_code >= 400:
+                        raise ProxyError(502, f"Upstream image returned {response.status_code}")
+                    chunks, size = [], 0
+                    async for chunk in response.aiter_bytes():
+                        size += len(chunk)
+                        if size > IMAGE_FETCH_MAX_BYTES:
+                            raise ProxyError(502, "Upstream image too large")
+                        chunks.append(chunk)
+                    return b"".join(chunks)
+        except BlockedTarget:
+            METRICS.inc("image_proxy.blocked_target")
+            raise ProxyError(403, "Image reference points at a non-public address")
+        except httpx.TooManyRedirects:
+            raise ProxyError(502, "Upstream image redirected too many times")
+
+    def _thumbnail(self, data: bytes) -> bytes:
+        try:
+            with Image.open(io.BytesIO(data)) as img:
+                img.thumbnail((self.width, self.width))
+                if img.mode not in ("RGB", "RGBA"):
+                    img = img.convert("RGBA" if "A" in img.getbands() or "transparency" in img.info else "RGB")
+                out = io.BytesIO()
+                img.save(out, "WEBP", quality=IMAGE_THUMB_QUALITY, method=4)
+                return out.getvalue()
+        except Exception as e:
+            raise ProxyError(502, f"Upstream image could not be decoded: {e}")
+
+    async def _build(self, key: str, url: str) -> Tuple[str, str]:
+        start = time.perf_counter()
+        original = await self._fetch(url)
+        thumb = await asyncio.to_thread(self._thumbnail, original)
+        entry = await asyncio.to_thread(self.cache.put, key, thumb)
+        METRICS.inc("image_proxy.bytes_saved", max(0, len(original) - len(thumb)))
+        METRICS.set_gauge("image_proxy.last_build_ms", round((time.perf_counter() - start) * 1000, 2))
+        return entry
+
+    async def serve(self, encoded: str, signature: str, if_none_match: Optional[str] = None) -> ProxiedImage:
+        """Cached thumbnail for a signed reference (fetching it once on a miss)"""
+        url = self.verify(encoded or "", signature or "")
+        key = hashlib.sha256(f"{self.width}:{url}".encode()).hexdigest()[:40]
+        entry = self.cache.get(key)
+        if entry is not None:
+            METRICS.inc("image_proxy.hit")
+        else:
+            METRICS.inc("image_proxy.miss")
+            # Concurrent first views of the same image share one fetch
+            future = self._inflight.get(key)
+            if future is None:
+                future = self._inflight[key] = asyncio.ensure_future(self._build(key, url))
+                future.add_done_callback(lambda _: self._inflight.pop(key, None))
+            entry = await asyncio.shield(future)
+        path, etag = entry
+        not_modified = bool(if_none_match) and (etag in if_none_match or if_none_match.strip() == "*")
+        return ProxiedImage(path, etag, not_modified)
+
+
+IMAGE_PROXY = ImageProxy()
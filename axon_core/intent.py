@@ -0,0 +1,201 @@
+"""
+Local intent gate for live web search.
+A compiled word-boundary matcher finds time-sensitive cue words, then a
+tiny logistic model over hashed word/bigram features decides whether the
+question actually needs fresh data ("latest iPhone news" vs "currently
+learning Python"). Trained once, lazily, from the examples below.
+Unambiguous phrasings ("how is the weather", "what time is it") skip the
+model, and a must-search / must-not-search list is re-checked on every fit.
+"""
+import os
+import re
+import math
+import zlib
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from axon_core.metrics import METRICS
+
+LIVE_SEARCH_THRESHOLD = float(os.getenv("LIVE_SEARCH_THRESHOLD", 0.6))
+HASH_BUCKETS = 1 << 12
+
+LIVE_CUES = re.compile(
+    r"\b(news|headlines?|weather|forecast|temperature|today|tonight|tomorrow|yesterday|"
+    r"current|latest|recent|live|now|this (?:week|month|year)|score|stock|price|election|"
+    r"trending|breaking|update[sd]?)\b",
+    re.IGNORECASE,
+)
+# Unambiguous real-time phrasings search without consulting the model
+STRONG_CUES = re.compile(
+    r"\b(?:what(?:'s| is) the weather|how(?:'s| is) the weather|weather (?:like |today|tonight|tomorrow|now|in |at |for )|"
+    r"forecast (?:for|in|today|tomorrow)|weather forecast|"
+    r"(?:latest|breaking|today's|top) (?:news|headlines)|news (?:today|headlines|right now)|"
+    r"what time is it|(?:current|exact|local) time|time (?:right )?now)\b",
+    re.IGNORECASE,
+)
+TOKEN_RE = re.compile(r"[a-z0-9']+")
+
+# (question, needs live data)
+TRAINING_EXAMPLES: List[Tuple[str, int]] = [
+    ("what is the latest news", 1),
+    ("latest news about india", 1),
+    ("today's headlines", 1),
+    ("any breaking news right now", 1),
+    ("what's the weather today", 1),
+    ("weather in delhi", 1),
+    ("what is the weather like in tokyo", 1),
+    ("how is the weather", 1),
+    ("how is the weather in paris today", 1),
+    ("is it cold outside in berlin right now", 1),
+    ("what is the current time", 1),
+    ("what time is it in new york", 1),
+    ("weather forecast for tomorrow in london", 1),
+    ("will it rain tomorrow", 1),
+    ("current temperature in mumbai", 1),
+    ("who won the match yesterday", 1),
+    ("live cricket score", 1),
+    ("what is the score of the football game", 1),
+    ("current bitcoin price", 1),
+    ("tesla stock price today", 1),
+    ("who is the current prime minister of uk", 1),
+    ("current president of the united states", 1),
+    ("latest iphone release date", 1),
+    ("what happened in the election", 1),
+    ("what is trending on twitter now", 1),
+    ("news about spacex launch this week", 1),
+    ("latest update on the war", 1),
+    ("recent earthquake news", 1),
+    ("what's happening in the world today", 1),
+    ("gold rate today", 1),
+    ("dollar to rupee exchange rate now", 1),
+    ("concurrent programming in python", 0),
+    ("i am currently learning python", 0),
+    ("explain current in electric circuits", 0),
+    ("what is alternating current", 0),
+    ("how does a current sensor work", 0),
+    ("what is the latest version of a list in python", 0),
+    ("how do i get the latest element of an array", 0),
+    ("write a function that returns the current date in javascript", 0),
+    ("how to get today's date in python", 0),
+    ("what should i cook today", 0),
+    ("i feel tired today", 0),
+    ("tell me a joke", 0),
+    ("write a poem about the weather", 0),
+    ("how do weather balloons work", 0),
+    ("explain how news websites make money", 0),
+    ("what is a live variable in compilers", 0),
+    ("how to update a dictionary in python", 0),
+    ("explain stock and flow in economics", 0),
+    ("what is the price elasticity of demand", 0),
+    ("who was the first president of the united states", 0),
+    ("explain recursion with an example", 0),
+    ("help me with my resume", 0),
+    ("what is photosynthesis", 0),
+    ("how to center a div in css", 0),
+]
+
+
+# Checked every time the model is fitted; a miss here is a gate regression
+MUST_SEARCH = (
+    "what is the weather like in tokyo",
+    "how is the weather",
+    "what is the weather in tokyo",
+    "weather forecast for tomorrow",
+    "what is the current time",
+    "what time is it in london",
+    "latest news about india",
+    "current bitcoin price",
+    "live cricket score",
+)
+MUST_NOT_SEARCH = (
+    "write a poem about the weather",
+    "how do weather balloons work",
+    "explain how news websites make money",
+    "i am currently learning python",
+    "what is alternating current",
+    "how to get today's date in python",
+    "what is the price elasticity of demand",
+    "tell me a joke",
+)
+
+
+def _bucket(feature: str) -> int:
+    return zlib.crc32(feature.encode("utf-8")) & (HASH_BUCKETS - 1)
+
+
+def features(text: str) -> List[int]:
+    """Hashed unigrams, bigrams and matched cue words"""
+    words = TOKEN_RE.findall(text.lower())
+    feats = [_bucket("w:" + w) for w in words]
+    feats.extend(_bucket(f"b:{a} {b}") for a, b in zip(words, words[1:]))
+    feats.extend(_bucket("cue:" + m.group(1).lower()) for m in LIVE_CUES.finditer(text))
+    return feats
+
+
+class IntentModel:
+    """Sparse logistic regression over hashed features"""
+
+    def __init__(self):
+        self.weights: Dict[int, float] = {}
+        self.bias = 0.0
+
+    def score(self, feats: List[int]) -> float:
+        z = self.bias + sum(self.weights.get(f, 0.0) for f in feats)
+        return 1.0 / (1.0 + math.exp(-max(-30.0, min(30.0, z))))
+
+    def fit(self, examples: List[Tuple[str, int]], epochs: int = 60, lr: float = 0.5, l2: float = 1e-3) -> "IntentModel":
+        data = [(features(text), label) for text, label in examples]
+        for _ in range(epochs):
+            for feats, label in data:
+                grad = self.score(feats) - label
+                self.bias -= lr * grad
+                for f in feats:
+                    w = self.weights.get(f, 0.0)
+                    self.weights[f] = w - lr * (grad + l2 * w)
+        return self
+
+
+_model: Optional[IntentModel] = None
+_model_lock = threading.Lock()
+
+
+def _decide(model: IntentModel, question: str, threshold: float) -> bool:
+    if STRONG_CUES.search(question):
+        return True
+    if not LIVE_CUES.search(question):
+        return False
+    return model.score(features(question)) >= threshold
+
+
+def regressions(model: IntentModel, threshold: float = LIVE_SEARCH_THRESHOLD) -> List[str]:
+    """Queries from MUST_SEARCH / MUST_NOT_SEARCH that the gate gets wrong"""
+    failures = [q for q in MUST_SEARCH if not _decide(model, q, threshold)]
+    failures.extend(q for q in MUST_NOT_SEARCH if _decide(model, q, threshold))
+    return failures
+
+
+def _get_model() -> IntentModel:
+    global _model
+    if _model is None:
+        with _model_lock:
+            if _model is None:
+                model = IntentModel().fit(TRAINING_EXAMPLES)
+                failures = regressions(model)
+                if failures:
+                    METRICS.inc("intent.regressions", len(failures))
+                    print(f"Intent Gate Warning: misclassified {failures}")
+                _model = model
+    return _model
+
+
+def live_data_score(question: str) -> float:
+    """Probability that answering `question` needs live web data"""
+    return _get_model().score(features(question))
+
+
+def needs_live_data(question: str, threshold: float = LIVE_SEARCH_THRESHOLD, record: bool = True) -> bool:
+    """Gate for get_live_data: strong cues always search, no cue word never does, the model decides the rest"""
+    needed = _decide(_get_model(), question, threshold)
+    if record:
+        METRICS.inc("intent.live_search.triggered" if needed else "intent.live_search.skipped")
+    return needed
@@ -0,0 +1,136 @@
+import os
+import time
+import importlib
+import importlib.util
+import threading
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Optional
+
+from axon_core.metrics import METRICS
+
+_import_lock = threading.RLock()
+
+# Heavy third-party modules the servers defer until first use
+HEAVY_MODULES = ("groq", "duckduckgo_search", "PIL.Image", "pytesseract", "bs4", "httpx", "numpy", "cv2")
+
+
+def _timed_import(name: str) -> Any:
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    METRICS.set_gauge(f"lazy_import.{name}.ms", round((time.perf_counter() - start) * 1000, 2))
+    return module
+
+
+class LazyModule:
+    """
+    Module proxy that imports the real module on first attribute access.
+    `on_load` runs once after import (e.g. to apply configuration).
+    """
+
+    def __init__(self, name: str, on_load: Optional[Callable[[Any], None]] = None):
+        self.__dict__["_name"] = name
+        self.__dict__["_on_load"] = on_load
+        self.__dict__["_module"] = None
+
+    def _load(self) -> Any:
+        module = self.__dict__["_module"]
+        if module is None:
+            with _import_lock:
+                module = self.__dict__["_module"]
+                if module is None:
+                    module = _timed_import(self._name)
+                    if self._on_load:
+                        self._on_load(module)
+                    self.__dict__["_module"] = module
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr: str, value: Any) -> None:
+        setattr(self._load(), attr, value)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_module"] is not None else "deferred"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+class LazyAttribute:
+    """Deferred `from module import name`; calling it resolves and calls the target"""
+
+    def __init__(self, module: str, attr: str):
+        self._module = LazyModule(module)
+        self._attr = attr
+
+    def resolve(self) -> Any:
+        return getattr(self._module, self._attr)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.resolve(), attr)
+
+
+class LazyObject:
+    """Proxy for an object (e.g. the Groq client) built by `factory` on first use"""
+
+    def __init__(self, factory: Callable[[], Any]):
+        self.__dict__["_factory"] = factory
+        self.__dict__["_target"] = None
+
+    def _resolve(self) -> Any:
+        target = self.__dict__["_target"]
+        if target is None:
+            with _import_lock:
+                target = self.__dict__["_target"]
+                if target is None:
+                    target = self._factory()
+                    self.__dict__["_target"] = target
+        return target
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._resolve(), attr)
+
+
+def lazy_import(name: str, on_load: Optional[Callable[[Any], None]] = None) -> LazyModule:
+    return LazyModule(name, on_load)
+
+
+def lazy_attr(module: str, attr: str) -> LazyAttribute:
+    return LazyAttribute(module, attr)
+
+
+@lru_cache(maxsize=None)
+def module_available(name: str) -> bool:
+    """Check a module is installed without importing it"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def prewarm(modules: Iterable[str] = HEAVY_MODULES, delay: float = 0.5) -> threading.Thread:
+    """Import heavy modules on a background thread once the server is up"""
+    def _run():
+        time.sleep(delay)
+        for name in modules:
+            if not module_available(name.split(".")[0]):
+                continue
+            try:
+                with _import_lock:
+                    _timed_import(name)
+            except Exception as e:
+                print(f"Prewarm Error ({name}): {e}")
+        METRICS.inc("lazy_import.prewarm_runs")
+
+    thread = threading.Thread(target=_run, name="axon-prewarm", daemon=True)
+    thread.start()
+    return thread
+
+
+def maybe_prewarm() -> Optional[threading.Thread]:
+    """Start a prewarm when AXON_PREWARM=1 (off by default for serverless cold starts)"""
+    if os.getenv("AXON_PREWARM", "0") == "1":
+        return prewarm(delay=float(os.getenv("AXON_PREWARM_DELAY", 0.5)))
+    return None
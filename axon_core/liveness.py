@@ -0,0 +1,171 @@
+"""
+Image URL validation for /img results.
+The top search candidates are probed concurrently (HEAD, or a one-byte
+ranged GET when HEAD is refused) over a pooled client that only connects
+to public addresses (see egress.py), ranked by status, content type, size
+and latency, and the verdicts are cached so popular images aren't
+re-probed on every request.
+"""
+import os
+import time
+import asyncio
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from axon_core.egress import BlockedTarget, public_client
+from axon_core.metrics import METRICS
+from axon_core.search import BING_HEADERS, VALID_IMAGE_EXTS, pick_best_image
+from axon_core.upstream import httpx
+
+IMAGE_CHECK_CANDIDATES = int(os.getenv("IMAGE_CHECK_CANDIDATES", 5))
+IMAGE_CHECK_TIMEOUT = float(os.getenv("IMAGE_CHECK_TIMEOUT", 2.5))
+IMAGE_CHECK_TTL = float(os.getenv("IMAGE_CHECK_TTL", 30 * 60))
+# Timeouts, connection errors and 5xx are often transient: remember them only briefly
+IMAGE_CHECK_ERROR_TTL = float(os.getenv("IMAGE_CHECK_ERROR_TTL", 60))
+IMAGE_CHECK_CACHE_MAX = int(os.getenv("IMAGE_CHECK_CACHE_MAX", 4096))
+
+PREFERRED_TYPES = ("image/jpeg", "image/png", "image/webp")
+MIN_IMAGE_BYTES = 8 * 1024          # smaller is usually a placeholder or tracking pixel
+MAX_IMAGE_BYTES = 8 * 1024 * 1024   # larger is slow to load inline
+
+
+@dataclass
+class Probe:
+    """Outcome of one liveness check"""
+    url: str
+    live: bool
+    content_type: str = ""
+    size: Optional[int] = None
+    latency: float = 0.0
+
+    def score(self, rank: int) -> float:
+        """Higher is better; search rank breaks ties"""
+        score = 0.0
+        if self.content_type in PREFERRED_TYPES:
+            score += 3
+        if self.size is not None:
+            if self.size < MIN_IMAGE_BYTES:
+                score -= 3
+            elif self.size > MAX_IMAGE_BYTES:
+                score -= 2
+            else:
+                score += 1
+        if self.url.lower().split("?")[0].endswith(VALID_IMAGE_EXTS):
+            score += 1
+        return score - self.latency - rank * 0.25
+
+
+class LivenessCache:
+    """TTL + LRU map of url -> Probe"""
+
+    def __init__(self, ttl: float = IMAGE_CHECK_TTL, max_entries: int = IMAGE_CHECK_CACHE_MAX):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Probe]]" = OrderedDict()
+        self._lock = threading.Lock()
+        METRICS.register_gauge("image_check.cache_entries", lambda: len(self._entries))
+
+    def get(self, url: str) -> Optional[Probe]:
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[url]
+                return None
+            self._entries.move_to_end(url)
+            return entry[1]
+
+    def put(self, probe: Probe, ttl: Optional[float] = None) -> None:
+        with self._lock:
+            self._entries[probe.url] = (time.monotonic() + (self.ttl if ttl is None else ttl), probe)
+            self._entries.move_to_end(probe.url)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+LIVENESS_CACHE = LivenessCache()
+
+_clients: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_clients_lock = threading.Lock()
+
+
+def _client():
+    """One pooled public-only AsyncClient per event loop (connections can't cross loops)"""
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        http = _clients.get(loop)
+        if http is None:
+            # Scraped URLs are untrusted: every hop, redirects included, must be a public address
+            http = _clients[loop] = public_client(
+                headers=BING_HEADERS, timeout=IMAGE_CHECK_TIMEOUT, follow_redirects=True,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            )
+        return http
+
+
+def _size(response) -> Optional[int]:
+    content_range = response.headers.get("content-range", "")
+    if "/" in content_range:
+        total = content_range.rsplit("/", 1)[1]
+        return int(total) if total.isdigit() else None
+    length = response.headers.get("content-length")
+    return int(length) if length and length.isdigit() else None
+
+
+async def probe(url: str) -> Probe:
+    """HEAD the URL, falling back to a ranged GET for hosts that reject HEAD"""
+    cached = LIVENESS_CACHE.get(url)
+    if cached is not None:
+        METRICS.inc("image_check.cache_hit")
+        return cached
+
+    http = _client()
+    start = time.perf_counter()
+    result = Probe(url, live=False)
+    ttl = None
+    try:
+        response = await http.head(url)
+        if response.status_code in (403, 405, 501) or not response.headers.get("content-type"):
+            async with http.stream("GET", url, headers={"Range": "bytes=0-0"}) as response:
+                pass  # headers are all we need; closing the stream drops the body
+        content_type = response.headers.get("content-type", "").split(";")[0].strip().lower()
+        result = Probe(
+            url,
+            live=response.status_code < 300 and content_type.startswith("image/"),
+            content_type=content_type,
+            size=_size(response),
+            latency=time.perf_counter() - start,
+        )
+        if response.status_code >= 500:
+            ttl = IMAGE_CHECK_ERROR_TTL
+    except BlockedTarget:
+        # Not transient; remember it for the full TTL
+        METRICS.inc("image_check.blocked")
+    except Exception as e:
+        METRICS.inc("image_check.error")
+        print(f"Image Check Error ({url[:60]}): {e}")
+        ttl = IMAGE_CHECK_ERROR_TTL
+    LIVENESS_CACHE.put(result, ttl)
+    METRICS.inc("image_check.live" if result.live else "image_check.dead")
+    return result
+
+
+async def best_live_image(results: List[str], candidates: int = IMAGE_CHECK_CANDIDATES) -> Optional[str]:
+    """
+    Best reachable image among the top `candidates` search results. When
+    none of them checks out, the unprobed remainder goes through the plain
+    extension heuristic rather than returning a URL known to be dead.
+    """
+    urls = list(dict.fromkeys(results))
+    if not urls:
+        return None
+    probes = await asyncio.gather(*(probe(url) for url in urls[:candidates]))
+    live = [(p.score(rank), p.url) for rank, p in enumerate(probes) if p.live]
+    if live:
+        return max(live)[1]
+    METRICS.inc("image_check.none_live")
+    return pick_best_image(urls[candidates:])
@@ -0,0 +1,83 @@
+import os
+import bisect
+import hashlib
+import threading
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, List
+
+MEMORY_SHARDS = int(os.getenv("MEMORY_SHARDS", 16))
+
+
+class HashRing:
+    """Consistent-hash ring mapping keys onto N shards via virtual nodes"""
+
+    def __init__(self, shards: int, vnodes: int = 64):
+        self.shards = shards
+        ring = []
+        for shard in range(shards):
+            for v in range(vnodes):
+                ring.append((self._hash(f"shard-{shard}#{v}"), shard))
+        ring.sort()
+        self._points = [p for p, _ in ring]
+        self._owners = [s for _, s in ring]
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+    def shard_for(self, key: str) -> int:
+        idx = bisect.bisect(self._points, self._hash(key)) % len(self._points)
+        return self._owners[idx]
+
+
+class ShardedMemory(MutableMapping):
+    """
+    Per-user neural memory split across independently locked shards.
+    Drop-in replacement for the plain NEURAL_MEMORY dict; keys are session ids.
+    """
+
+    def __init__(self, shards: int = MEMORY_SHARDS):
+        self._ring = HashRing(shards)
+        self._shards: List[Dict[str, Any]] = [{} for _ in range(shards)]
+        self._locks = [threading.RLock() for _ in range(shards)]
+
+    def _index(self, key: str) -> int:
+        return self._ring.shard_for(key)
+
+    def lock_for(self, key: str) -> threading.RLock:
+        """Lock guarding the shard that owns `key` (for read-modify-write sequences)"""
+        return self._locks[self._index(key)]
+
+    def __getitem__(self, key: str) -> Any:
+        i = self._index(key)
+        with self._locks[i]:
+            return self._shards[i][key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        i = self._index(key)
+        with self._locks[i]:
+            self._shards[i][key] = value
+
+    def __delitem__(self, key: str) -> None:
+        i = self._index(key)
+        with self._locks[i]:
+            del self._shards[i][key]
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        i = self._index(key)
+        with self._locks[i]:
+            return key in self._shards[i]
+
+    def __iter__(self) -> Iterator[str]:
+        for i, shard in enumerate(self._shards):
+            with self._locks[i]:
+                keys = list(shard)
+            yield from keys
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+    def shard_sizes(self) -> List[int]:
+        return [len(shard) for shard in self._shards]
@@ -0,0 +1,45 @@
+import threading
+from typing import Callable, Dict, Any
+
+
+class MetricsRegistry:
+    """Thread-safe in-process counters and gauges exported via /metrics"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = {}
+        self._gauges: Dict[str, float] = {}
+        self._callbacks: Dict[str, Callable[[], Any]] = {}
+
+    def inc(self, name: str, value: float = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def counter(self, name: str) -> float:
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def set_gauge(self, name: str, value: float) -> None:
+        with self._lock:
+            self._gauges[name] = value
+
+    def register_gauge(self, name: str, fn: Callable[[], Any]) -> None:
+        """Register a gauge whose value is computed lazily at snapshot time"""
+        with self._lock:
+            self._callbacks[name] = fn
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            counters = dict(self._counters)
+            gauges = dict(self._gauges)
+            callbacks = dict(self._callbacks)
+        for name, fn in callbacks.items():
+            try:
+                gauges[name] = fn()
+            except Exception as e:
+                gauges[name] = f"error: {e}"
+        return {"counters": counters, "gauges": gauges}
+
+
+# Process-wide registry shared by every subsystem
+METRICS = MetricsRegistry()
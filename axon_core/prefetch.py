@@ -0,0 +1,75 @@
+"""
+Speculative live-search prefetch.
+While the user is still typing, the frontends send the draft question;
+if it looks like it needs live data, the search runs ahead of time into
+LIVE_SEARCH_CACHE so the eventual /ask finds it warm.
+"""
+import os
+import asyncio
+from typing import Dict, Optional
+
+from axon_core.admission import RateLimiter
+from axon_core.intent import needs_live_data
+from axon_core.metrics import METRICS
+from axon_core.search import LIVE_SEARCH_CACHE
+
+PREFETCH_PER_MINUTE = float(os.getenv("PREFETCH_PER_MINUTE", 20))
+PREFETCH_BURST = int(os.getenv("PREFETCH_BURST", 5))
+PREFETCH_SETTLE_SECONDS = float(os.getenv("PREFETCH_SETTLE_SECONDS", 0.25))
+PREFETCH_MIN_CHARS = int(os.getenv("PREFETCH_MIN_CHARS", 6))
+
+# Prefetch outcomes reported back to the client
+SCHEDULED, CACHED, SKIPPED, CANCELLED = "scheduled", "cached", "skipped", "cancelled"
+
+
+class SearchPrefetcher:
+    """
+    At most one pending prefetch per user: a newer draft cancels the older
+    one. Runs on the engine's event loop; the search itself is on a worker
+    thread, so a prefetch cancelled mid-fetch still lands in the cache.
+    """
+
+    def __init__(self, per_minute: float = PREFETCH_PER_MINUTE, burst: int = PREFETCH_BURST):
+        self.limiter = RateLimiter(per_minute, burst, name="prefetch")
+        self._pending: Dict[str, asyncio.Task] = {}
+        METRICS.register_gauge("prefetch.pending", lambda: len(self._pending))
+
+    def cancel(self, user_id: str) -> bool:
+        task = self._pending.pop(user_id, None)
+        if task is None or task.done():
+            return False
+        task.cancel()
+        METRICS.inc("prefetch.cancelled")
+        return True
+
+    async def submit(self, user_id: str, draft: str, limit_key: Optional[str] = None) -> str:
+        """
+        Start a prefetch for `draft`; raises AdmissionRejected when over the
+        per-user limit. `limit_key` is the admission key the bucket is charged
+        to (the user id when omitted).
+        """
+        draft = draft.strip()
+        if len(draft) < PREFETCH_MIN_CHARS:
+            return CANCELLED if self.cancel(user_id) else SKIPPED
+        if LIVE_SEARCH_CACHE.peek(draft) is not None:
+            return CACHED
+        if not needs_live_data(draft, record=False):
+            self.cancel(user_id)
+            return SKIPPED
+        self.limiter.check(limit_key or user_id)
+        self.cancel(user_id)
+        task = asyncio.get_running_loop().create_task(self._run(user_id, draft))
+        self._pending[user_id] = task
+        METRICS.inc("prefetch.scheduled")
+        return SCHEDULED
+
+    async def _run(self, user_id: str, draft: str) -> None:
+        try:
+            # Short settle window: keystrokes that arrive meanwhile cancel this one for free
+            await asyncio.sleep(PREFETCH_SETTLE_SECONDS)
+            await asyncio.to_thread(LIVE_SEARCH_CACHE.get, draft)
+        except Exception as e:
+            print(f"Prefetch Error: {e}")
+        finally:
+            if self._pending.get(user_id) is asyncio.current_task():
+                del self._pending[user_id]
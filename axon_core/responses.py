@@ -0,0 +1,123 @@
+"""Canned replies for slash commands, greetings and creator questions"""
+import random
+from typing import Optional
+
+JOKES = ["Why do programmers prefer dark mode? Because light attracts bugs.", "Real programmers count from 0.", "How many programmers does it take to change a light bulb? None, it's a hardware problem."]
+QUOTES = ["The best way to predict the future is to invent it. - Alan Kay", "Intelligence is the ability to adapt to change. - Stephen Hawking", "The advance of technology is based on making it fit in. - Bill Gates"]
+TIPS = ["Learn to use a debugger early.", "Keep your functions small and focused.", "Automate repetitive tasks with scripts."]
+
+HELP_MESSAGE = "<strong>Available features:</strong><br>/intro, /clear, /functions, /video [topic], /vid [topic], /joke, /quote, /tip, /image [query], /img [query], /tictactoe [easy|medium|hard], /guessnumber, open [app]"
+
+INTRO_MESSAGE = """
+# Welcome to **AXON AI**
+
+I'm delighted to introduce myself as your digital companion. I'm here to provide you with in-depth knowledge, expert insights, and personalized assistance across various domains.
+
+### Popular areas of interest:
+*   **Science & Tech**: AI, Space, and Biotech.
+*   **Art & Culture**: History, Music, and Art.
+*   **Performance**: Productivity and Skills.
+
+How can I help you today?
+"""
+
+CLEAR_MESSAGE = "Neural memory reset. Chat cleared ✅"
+
+BASIC_REPLIES = {
+    ("hello", "hi", "hey", "hola", "greetings"): "Hello! I am **AXON AI**, your digital companion. How can I assist you today? 🧠✨",
+    ("how are you", "how are you doing", "how's it going"): "My neural circuits are functioning at peak efficiency! Powering through trillions of operations per second to provide you with the best experience. How can I assist you today?",
+    ("thank you", "thanks", "thx", "appreciate it"): "You're very welcome! It's my pleasure to assist. Is there anything else you'd like to dive into?",
+    ("bye", "goodbye", "exit", "see ya"): "Goodbye! My systems will remain in standby until your next request. Stay curious! 🚀",
+}
+
+CREATOR_INFO = """
+# 🧠 Yash Tambade
+> "Building small things that feel big"
+
+### 🚀 About Creator
+Yash Tambade is a young tech enthusiast from Navi Mumbai, currently pursuing a B.Tech in Computer Science (2025–2029). He focuses on frontend development, UI design, AI experiments, and interactive web projects.
+
+### 📌 Key Details
+- **🎂 Age:** 17
+- **📍 Location:** Navi Mumbai, Maharashtra, India
+- **🎓 Education:** B.Tech in Computer Science
+
+### ⚡ Skills
+- HTML, CSS, JavaScript
+- Python Programming
+- UI/UX Design
+- Game Logic & Interactive Projects
+
+### 🛠️ Projects
+- **Axon AI:** AI chatbot with real-time neural search integration.
+- **GameBox:** Collection of immersive Scratch mini-games.
+- **Mini Games & Apps:** Various interactive web-based projects.
+- **Portfolio Website:** Professional digital showcase.
+
+### 🌐 Connect with Developer
+- **GitHub (Prod):** [github.com/yashtambade56-ux](https://github.com/yashtambade56-ux)
+- **GitHub (Lab):** [github.com/Yashhh710](https://github.com/Yashhh710)
+- **LinkedIn:** [linkedin.com/in/yash-tambade-173508379](https://linkedin.com/in/yash-tambade-173508379)
+- **Portfolio:** [Portfolio v1](https://yashhh710.github.io/Portfolio_v1/)
+- **📧 Email:** [yashtambade56@gmail.com](mailto:yashtambade56@gmail.com)
+"""
+
+
+def basic_reply(q_lower: str) -> Optional[str]:
+    for triggers, reply in BASIC_REPLIES.items():
+        if q_lower in triggers:
+            return reply
+    return None
+
+
+def command_reply(q_lower: str) -> Optional[str]:
+    """Replies for the stateless slash commands, or None"""
+    if q_lower.startswith("/functions") or q_lower.startswith("/help"):
+        return HELP_MESSAGE
+    if q_lower.startswith("/joke"):
+        return f"🤖 {random.choice(JOKES)}"
+    if q_lower.startswith("/quote"):
+        return f"✨ <em>\"{random.choice(QUOTES)}\"</em>"
+    if q_lower.startswith("/intro") or q_lower.startswith("/welcome"):
+        return INTRO_MESSAGE
+    if q_lower.startswith("/tip"):
+        return f"💡 <strong>Pro Tip:</strong> {random.choice(TIPS)}"
+    return None
+
+
+def is_creator_query(text: str) -> bool:
+    """Detect if the query is about the creator or developer with comprehensive keyword matching"""
+    text_lower = text.lower().strip()
+
+    # 1. Direct triggers
+    direct_triggers = [
+        "@dev", "/dev", "yash tambade", "yashhh", "about axon ai",
+        "axon ai creator", "axon ai developer", "who is yash", "about yash"
+    ]
+    if any(t in text_lower for t in direct_triggers):
+        return True
+
+    # 2. Key phrases
+    key_phrases = [
+        "who made you", "who created you", "who built you", "who is your developer",
+        "who is behind this", "who owns this", "who developed this", "who coded you",
+        "your creator", "your developer", "your owner", "tell me about developer",
+        "tell me about creator", "info about developer", "info about creator",
+        "developer info", "creator info", "dev info", "creator details",
+        "developer details", "about developer", "about creator", "about you"
+    ]
+    if any(p in text_lower for p in key_phrases):
+        return True
+
+    # 3. Keyword combinations (Heuristic)
+    creators = ["creator", "developer", "owner", "builder", "coded", "developed", "built", "made"]
+    targets = ["you", "axon", "this app", "this ai", "assistant", "ai"]
+
+    has_creator = any(word in text_lower for word in creators)
+    has_target = any(word in text_lower for word in targets)
+
+    # Check for "dev" as a standalone word or in common contexts
+    if " dev " in f" {text_lower} " or text_lower == "dev":
+        return True
+
+    return has_creator and has_target
@@ -0,0 +1,174 @@
+import os
+import time
+import asyncio
+import heapq
+import itertools
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Optional
+
+from axon_core.metrics import METRICS
+
+# Priority classes (lower value is dispatched first)
+INTERACTIVE = 0   # plain text chat turns
+IMAGE_SEARCH = 1  # short keyword/description helper prompts for /img
+VISION = 2        # large multimodal analyses
+BACKGROUND = 3    # history summarization and other deferrable work
+
+PRIORITY_NAMES = {
+    INTERACTIVE: "interactive",
+    IMAGE_SEARCH: "image_search",
+    VISION: "vision",
+    BACKGROUND: "background",
+}
+
+LLM_UPSTREAM_CONCURRENCY = int(os.getenv("LLM_UPSTREAM_CONCURRENCY", 4))
+LLM_DEADLINE_SECONDS = float(os.getenv("LLM_DEADLINE_SECONDS", 60))
+BACKGROUND_DEADLINE_SECONDS = float(os.getenv("BACKGROUND_DEADLINE_SECONDS", 30))
+
+# Clients may announce how long they are willing to wait (seconds)
+DEADLINE_HEADER = "X-Request-Timeout"
+
+
+class DeadlineExceeded(Exception):
+    """Raised when a queued LLM call is shed because its deadline has passed"""
+
+
+def deadline_from_header(value: Optional[str], default: float = LLM_DEADLINE_SECONDS) -> float:
+    """Turn a client timeout header into an absolute monotonic deadline"""
+    budget = default
+    if value:
+        try:
+            budget = min(float(value), default)
+        except ValueError:
+            pass
+    return time.monotonic() + budget
+
+
+def background_deadline() -> float:
+    return time.monotonic() + BACKGROUND_DEADLINE_SECONDS
+
+
+class _Waiter:
+    """A queued coroutine; whoever releases a slot hands it over and then wakes it on its own loop"""
+    __slots__ = ("priority", "seq", "wake", "granted", "cancelled")
+
+    def __init__(self, priority: int, seq: int, wake: Callable[[], bool]):
+        self.priority = priority
+        self.seq = seq
+        self.wake = wake          # returns False if the waiter can no longer be woken
+        self.granted = False
+        self.cancelled = False
+
+    def __lt__(self, other: "_Waiter") -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+class LLMScheduler:
+    """
+    Bounded-concurrency priority gate in front of the Groq API.
+    Callers wait until they are the highest-priority waiter and a slot is
+    free. Requests whose deadline passes while queued are shed before any
+    tokens are spent on them. A queued call waits on a future of its own
+    loop, so it holds no worker thread.
+    """
+
+    def __init__(self, max_concurrent: int = LLM_UPSTREAM_CONCURRENCY):
+        self.max_concurrent = max_concurrent
+        self._lock = threading.Lock()
+        self._running = 0
+        self._waiting: List[_Waiter] = []  # heap ordered by (priority, seq)
+        self._seq = itertools.count()
+        METRICS.register_gauge("scheduler.llm.queued", lambda: sum(not w.cancelled for w in self._waiting))
+        METRICS.register_gauge("scheduler.llm.running", lambda: self._running)
+
+    def _shed(self, priority: int) -> None:
+        METRICS.inc(f"scheduler.llm.shed.{PRIORITY_NAMES[priority]}")
+        raise DeadlineExceeded(f"{PRIORITY_NAMES[priority]} request deadline passed before dispatch")
+
+    def _try_enter(self, priority: int, wake: Callable[[], bool]) -> Optional[_Waiter]:
+        """Take a free slot (None) or queue a waiter; caller must hold the lock"""
+        while self._waiting and self._waiting[0].cancelled:
+            heapq.heappop(self._waiting)
+        if self._running < self.max_concurrent and not self._waiting:
+            self._running += 1
+            return None
+        waiter = _Waiter(priority, next(self._seq), wake)
+        heapq.heappush(self._waiting, waiter)
+        return waiter
+
+    def _dispatch(self) -> None:
+        # Caller must hold the lock
+        while self._running < self.max_concurrent and self._waiting:
+            waiter = heapq.heappop(self._waiting)
+            if waiter.cancelled:
+                continue
+            waiter.granted = True
+            self._running += 1
+            if not waiter.wake():
+                # Its event loop is gone; nobody will use or return the slot
+                self._running -= 1
+
+    def _admitted(self, priority: int, start: float) -> None:
+        METRICS.inc(f"scheduler.llm.wait_seconds.{PRIORITY_NAMES[priority]}", time.monotonic() - start)
+        METRICS.inc(f"scheduler.llm.dispatched.{PRIORITY_NAMES[priority]}")
+
+    async def _aacquire(self, priority: int, deadline: Optional[float]) -> None:
+        start = time.monotonic()
+        if deadline is not None and start >= deadline:
+            self._shed(priority)
+        loop = asyncio.get_running_loop()
+        admitted = loop.create_future()
+
+        def resolve() -> None:
+            if admitted.cancelled():
+                self.release()  # granted after the caller gave up
+            else:
+                admitted.set_result(None)
+
+        def wake() -> bool:
+            try:
+                loop.call_soon_threadsafe(resolve)
+                return True
+            except RuntimeError:
+                return False
+
+        with self._lock:
+            waiter = self._try_enter(priority, wake)
+        if waiter is not None:
+            try:
+                await asyncio.wait_for(admitted, None if deadline is None else max(0.0, deadline - time.monotonic()))
+            except BaseException as e:
+                if admitted.done() and not admitted.cancelled():
+                    self.release()  # admitted in the same tick the caller was cancelled
+                    raise
+                with self._lock:
+                    if not waiter.granted:
+                        waiter.cancelled = True  # otherwise resolve() hands the slot back
+                if isinstance(e, asyncio.TimeoutError):
+                    self._shed(priority)
+                raise
+        self._admitted(priority, start)
+
+    def release(self) -> None:
+        with self._lock:
+            self._running = max(0, self._running - 1)
+            self._dispatch()
+
+    @asynccontextmanager
+    async def aslot(self, priority: int, deadline: Optional[float] = None) -> AsyncIterator[None]:
+        """Async admission: the queue wait is a future on the caller's loop, not a parked thread"""
+        await self._aacquire(priority, deadline)
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def arun(self, priority: int, fn: Callable[..., Awaitable[Any]], *args,
+                   deadline: Optional[float] = None, **kwargs) -> Any:
+        async with self.aslot(priority, deadline):
+            return await fn(*args, **kwargs)
+
+
+# Process-wide scheduler shared by every Groq call site
+LLM_SCHEDULER = LLMScheduler()
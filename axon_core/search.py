@@ -0,0 +1,254 @@
+"""Live web, image and video search via DuckDuckGo with a Bing scraper fallback"""
+import os
+import re
+import html
+import json
+import time
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from axon_core.metrics import METRICS
+from axon_core.upstream import BING_BREAKER, DDGS, DDGS_BREAKER, BeautifulSoup, httpx
+
+SEARCH_CACHE_TTL = float(os.getenv("SEARCH_CACHE_TTL", 300))
+SEARCH_CACHE_MAX = int(os.getenv("SEARCH_CACHE_MAX", 512))
+BING_MAX_RESULTS = int(os.getenv("BING_MAX_RESULTS", 10))
+
+BING_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36"
+}
+VALID_IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".webp")
+
+
+def get_live_data(query: str) -> str:
+    """Get live search data via DuckDuckGo; "" when there is none (no results, breaker open, lookup failed)"""
+    try:
+        with DDGS_BREAKER, DDGS() as ddgs:
+            results = ddgs.text(query, max_results=3)
+            return "\n".join([r["body"] for r in results]) if results else ""
+    except Exception as e:
+        # The failure is ours to log; it must never reach the prompt as "real-time" context
+        METRICS.inc("search.live.failed")
+        print(f"Live Search Error: {e}")
+        return ""
+
+
+_NON_WORD = re.compile(r"[^\w\s]+")
+
+
+def normalize_query(query: str) -> str:
+    """Cache key for a query: lowercase words without punctuation"""
+    return " ".join(_NON_WORD.sub(" ", query.lower()).split())
+
+
+class LiveSearchCache:
+    """
+    TTL + LRU cache of live search context keyed by normalized query.
+    Concurrent lookups for the same query share one in-flight fetch, so a
+    prefetch that is still running is joined rather than repeated.
+    """
+
+    def __init__(self, ttl: float = SEARCH_CACHE_TTL, max_entries: int = SEARCH_CACHE_MAX):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        METRICS.register_gauge("search_cache.entries", lambda: len(self._entries))
+
+    @staticmethod
+    def key(query: str) -> str:
+        return normalize_query(query)
+
+    def peek(self, query: str) -> Optional[str]:
+        key = self.key(query)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                return entry[1]
+        return None
+
+    def get(self, query: str) -> str:
+        """Cached context for `query`, fetching (or joining an in-flight fetch) on a miss"""
+        key = self.key(query)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                METRICS.inc("search_cache.hit")
+                return entry[1]
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+        if not owner:
+            METRICS.inc("search_cache.joined")
+            return future.result()
+
+        METRICS.inc("search_cache.miss")
+        result = ""
+        try:
+            result = get_live_data(query)
+        finally:
+            with self._lock:
+                # Failed or empty lookups come back as "" and are never cached
+                if result:
+                    self._entries[key] = (time.monotonic() + self.ttl, result)
+                    self._entries.move_to_end(key)
+                    while len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+                del self._inflight[key]
+            future.set_result(result)
+        return result
+
+
+LIVE_SEARCH_CACHE = LiveSearchCache()
+
+
+def cached_live_data(query: str) -> str:
+    """get_live_data through the shared TTL cache (warmed by prefetch)"""
+    return LIVE_SEARCH_CACHE.get(query)
+
+
+def ddgs_image_search(query: str) -> List[str]:
+    """Integrated Image Search via DuckDuckGo Neural Gateway"""
+    try:
+        results = []
+        with DDGS_BREAKER, DDGS() as ddgs:
+            # We convert the generator to a list to avoid issues with closing the context
+            ddgs_gen = list(ddgs.images(
+                keywords=query,
+                region="wt-wt",
+                safesearch="off",
+                max_results=10
+            ))
+            for r in ddgs_gen:
+                img_url = r.get("image") or r.get("thumbnail")
+                if img_url:
+                    results.append(img_url)
+        return results
+    except Exception as e:
+        print(f"DDGS Image Search Error: {e}")
+        return []
+
+
+def _bing_url(query: str) -> str:
+    return f"https://www.bing.com/images/search?q={query}&form=HDRSC2&first=1"
+
+
+def _parse_bing(page: str) -> List[str]:
+    """Full-tree parse; kept as the fallback when the fast extractor finds nothing"""
+    soup = BeautifulSoup(page, 'html.parser')
+    results = []
+    for a in soup.find_all("a", class_="iusc"):
+        m = a.get("m")
+        if m:
+            m_data = json.loads(m)
+            img_url = m_data.get("murl")
+            if img_url:
+                results.append(img_url)
+    return results
+
+
+class BingImageExtractor:
+    """
+    Incremental scanner for the `murl` field inside the HTML-escaped JSON of
+    each result's `m` attribute. Fed the response a chunk at a time, it keeps
+    only a short unmatched tail and reports when `limit` URLs are found, so
+    the download can stop early instead of building a full DOM.
+    """
+
+    MURL = re.compile(r'murl(?:&quot;|"):(?:&quot;|")(.*?)(?:&quot;|")')
+    MAX_TAIL = 4096  # longer than any image URL we care about
+
+    def __init__(self, limit: int = BING_MAX_RESULTS):
+        self.limit = limit
+        self.results: List[str] = []
+        self._seen = set()
+        self._buffer = ""
+
+    @property
+    def done(self) -> bool:
+        return len(self.results) >= self.limit
+
+    def feed(self, chunk: str) -> bool:
+        """Scan another chunk; returns True once enough URLs have been collected"""
+        buffer = self._buffer + chunk
+        end = 0
+        for match in self.MURL.finditer(buffer):
+            end = match.end()
+            url = self._decode(match.group(1))
+            if url and url not in self._seen:
+                self._seen.add(url)
+                self.results.append(url)
+                if self.done:
+                    break
+        # Keep the unscanned tail so a match split across chunks is found next time
+        self._buffer = buffer[max(end, len(buffer) - self.MAX_TAIL):]
+        return self.done
+
+    @staticmethod
+    def _decode(raw: str) -> str:
+        url = html.unescape(raw)
+        if "\\" in url:
+            try:
+                url = json.loads(f'"{url}"')
+            except ValueError:
+                return ""
+        return url
+
+    @classmethod
+    def extract(cls, chunks: Iterable[str], limit: int = BING_MAX_RESULTS) -> List[str]:
+        extractor = cls(limit)
+        for chunk in chunks:
+            if extractor.feed(chunk):
+                break
+        return extractor.results
+
+
+async def abing_image_search(query: str, limit: int = BING_MAX_RESULTS) -> List[str]:
+    """Fallback image search: streams Bing's results page over httpx and stops at `limit` URLs"""
+    try:
+        with BING_BREAKER:
+            async with httpx.AsyncClient(headers=BING_HEADERS, timeout=10, follow_redirects=True) as http:
+                async with http.stream("GET", _bing_url(query)) as response:
+                    response.raise_for_status()
+                    extractor = BingImageExtractor(limit)
+                    page = []
+                    async for chunk in response.aiter_text():
+                        page.append(chunk)
+                        if extractor.feed(chunk):
+                            break
+        if extractor.results:
+            return extractor.results
+        METRICS.inc("bing.extract.fallback")
+        return (await asyncio.to_thread(_parse_bing, "".join(page)))[:limit]
+    except Exception as e:
+        print(f"Bing Search Error: {e}")
+        return []
+
+
+async def aimage_search(query: str) -> List[str]:
+    """Hybrid search: DuckDuckGo first (its client is sync-only, so on a worker thread), then Bing"""
+    return await asyncio.to_thread(ddgs_image_search, query) or await abing_image_search(query)
+
+
+def pick_best_image(results: List[str]) -> Optional[str]:
+    """Prioritize direct links with common extensions, else the first result"""
+    for url in results:
+        if url.lower().endswith(VALID_IMAGE_EXTS):
+            return url
+    return results[0] if results else None
+
+
+def video_search(query: str) -> Optional[Dict[str, str]]:
+    """Top DuckDuckGo video hit for a tutorial topic"""
+    try:
+        with DDGS_BREAKER, DDGS() as ddgs:
+            results = list(ddgs.videos(query, max_results=1))
+            return results[0] if results else None
+    except Exception:
+        return None
@@ -0,0 +1,75 @@
+"""
+Pluggable JSON serializer for response bodies.
+Uses orjson when it is installed, otherwise the stdlib encoder configured
+for the same compact, non-ASCII-escaping output. Bodies encoded ahead of
+time are wrapped in RawJSON and passed through untouched.
+"""
+import os
+import json
+from typing import Any
+
+from axon_core.lazy import lazy_import, module_available
+from axon_core.metrics import METRICS
+
+JSON_SERIALIZER = os.getenv("JSON_SERIALIZER", "auto")  # auto | orjson | stdlib
+
+orjson = lazy_import("orjson")
+
+
+class RawJSON(bytes):
+    """An already-encoded JSON document; `dumps` returns it unchanged"""
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if isinstance(obj, bytes):
+        return obj.decode("utf-8", "replace")
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class StdlibSerializer:
+    name = "stdlib"
+
+    def __init__(self):
+        self._encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=_default)
+
+    def dumps(self, obj: Any) -> bytes:
+        if isinstance(obj, RawJSON):
+            return obj
+        return self._encoder.encode(obj).encode("utf-8")
+
+
+class OrjsonSerializer(StdlibSerializer):
+    """orjson fast path; payloads it rejects (e.g. >64-bit ints) go through the stdlib encoder"""
+    name = "orjson"
+
+    def __init__(self):
+        super().__init__()
+        self._dumps = orjson.dumps
+        self._options = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: Any) -> bytes:
+        if isinstance(obj, RawJSON):
+            return obj
+        try:
+            return self._dumps(obj, default=_default, option=self._options)
+        except TypeError:
+            METRICS.inc("serializer.fallback")
+            return super().dumps(obj)
+
+
+def get_serializer(name: str = JSON_SERIALIZER) -> StdlibSerializer:
+    if name in ("auto", "orjson") and module_available("orjson"):
+        return OrjsonSerializer()
+    if name == "orjson":
+        print("Serializer Error: orjson is not installed, using the stdlib encoder")
+    return StdlibSerializer()
+
+
+SERIALIZER = get_serializer()
+METRICS.register_gauge("serializer.backend", lambda: SERIALIZER.name)
+
+
+def dumps(obj: Any) -> bytes:
+    return SERIALIZER.dumps(obj)
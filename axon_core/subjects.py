@@ -0,0 +1,130 @@
+"""
+Persistent cache of LLM helper outputs for /img subjects.
+Optimized search keywords and one-line descriptions depend only on the
+subject, so they are shared across users and restarts in a small SQLite
+table with a TTL and least-recently-used eviction.
+"""
+import os
+import time
+import asyncio
+import sqlite3
+import tempfile
+import threading
+from typing import Dict, Iterable, Optional
+
+from axon_core.metrics import METRICS
+from axon_core.search import normalize_query
+
+SUBJECT_CACHE_PATH = os.getenv("SUBJECT_CACHE_PATH", os.path.join(tempfile.gettempdir(), "axon-subjects.sqlite3"))
+SUBJECT_CACHE_TTL = float(os.getenv("SUBJECT_CACHE_TTL", 7 * 24 * 3600))
+SUBJECT_CACHE_MAX = int(os.getenv("SUBJECT_CACHE_MAX", 5000))
+
+# Helper output kinds
+KEYWORDS = "keywords"
+DESCRIPTION = "description"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS subject_cache (
+    kind TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    value TEXT NOT NULL,
+    created REAL NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (kind, subject)
+);
+CREATE INDEX IF NOT EXISTS subject_cache_lru ON subject_cache (last_used);
+"""
+
+
+class SubjectCache:
+    def __init__(self, path: str = SUBJECT_CACHE_PATH, ttl: float = SUBJECT_CACHE_TTL,
+                 max_entries: int = SUBJECT_CACHE_MAX):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        METRICS.register_gauge("subject_cache.entries", self._count)
+
+    def _db(self) -> sqlite3.Connection:
+        # Opened on first use so importing the engine never touches the disk
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _count(self) -> int:
+        with self._lock:
+            if self._conn is None:
+                return 0
+            return self._conn.execute("SELECT COUNT(*) FROM subject_cache").fetchone()[0]
+
+    def get_many(self, kind: str, subjects: Iterable[str]) -> Dict[str, str]:
+        """Fresh cached values for `subjects` (keyed by the subject as given)"""
+        keys = {subject: normalize_query(subject) for subject in subjects}
+        now = time.time()
+        found: Dict[str, str] = {}
+        try:
+            with self._lock:
+                db = self._db()
+                for subject, key in keys.items():
+                    row = db.execute(
+                        "SELECT value FROM subject_cache WHERE kind = ? AND subject = ? AND created > ?",
+                        (kind, key, now - self.ttl),
+                    ).fetchone()
+                    if row is not None:
+                        found[subject] = row[0]
+                        db.execute("UPDATE subject_cache SET last_used = ? WHERE kind = ? AND subject = ?", (now, kind, key))
+        except sqlite3.Error as e:
+            print(f"Subject Cache Error: {e}")
+            return {}
+        METRICS.inc(f"subject_cache.{kind}.hit", len(found))
+        METRICS.inc(f"subject_cache.{kind}.miss", len(keys) - len(found))
+        return found
+
+    def get(self, kind: str, subject: str) -> Optional[str]:
+        return self.get_many(kind, (subject,)).get(subject)
+
+    def put_many(self, kind: str, values: Dict[str, str]) -> None:
+        if not values:
+            return
+        now = time.time()
+        rows = [(kind, normalize_query(subject), value, now, now) for subject, value in values.items()]
+        try:
+            with self._lock:
+                db = self._db()
+                db.executemany(
+                    "INSERT OR REPLACE INTO subject_cache (kind, subject, value, created, last_used) VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+                # Expired rows first, then the least recently used beyond the cap
+                db.execute("DELETE FROM subject_cache WHERE created <= ?", (now - self.ttl,))
+                db.execute(
+                    "DELETE FROM subject_cache WHERE rowid IN ("
+                    " SELECT rowid FROM subject_cache ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+        except sqlite3.Error as e:
+            print(f"Subject Cache Error: {e}")
+
+    def put(self, kind: str, subject: str, value: str) -> None:
+        self.put_many(kind, {subject: value})
+
+    # Disk I/O runs on a worker thread so ASGI requests never stall behind it
+    async def aget(self, kind: str, subject: str) -> Optional[str]:
+        return await asyncio.to_thread(self.get, kind, subject)
+
+    async def aget_many(self, kind: str, subjects: Iterable[str]) -> Dict[str, str]:
+        return await asyncio.to_thread(self.get_many, kind, list(subjects))
+
+    async def aput(self, kind: str, subject: str, value: str) -> None:
+        await asyncio.to_thread(self.put, kind, subject, value)
+
+    async def aput_many(self, kind: str, values: Dict[str, str]) -> None:
+        await asyncio.to_thread(self.put_many, kind, values)
+
+
+SUBJECT_CACHE = SubjectCache()
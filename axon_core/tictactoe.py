@@ -0,0 +1,104 @@
+"""
+Bitboard Tic-Tac-Toe engine.
+A position is two 9-bit ints (X marks, O marks; bit i = square i). Every
+legal position reachable from the empty board (5,478 of them) is solved
+once with negamax into a table, so choosing a move is a dict lookup.
+"""
+import random
+import threading
+from typing import Dict, List, Optional, Tuple
+
+FULL = 0x1FF
+WIN_MASKS = (0b000000111, 0b000111000, 0b111000000,   # rows
+             0b001001001, 0b010010010, 0b100100100,   # columns
+             0b100010001, 0b001010100)                # diagonals
+
+# Difficulty levels: chance of playing a table-optimal move (else any legal move)
+LEVELS = {"easy": 0.0, "medium": 0.7, "hard": 1.0}
+DEFAULT_LEVEL = "medium"
+
+
+def has_line(bits: int) -> bool:
+    for mask in WIN_MASKS:
+        if bits & mask == mask:
+            return True
+    return False
+
+
+def empty_squares(x: int, o: int) -> List[int]:
+    free = ~(x | o) & FULL
+    return [i for i in range(9) if free >> i & 1]
+
+
+def x_to_move(x: int, o: int) -> bool:
+    return bin(x).count("1") == bin(o).count("1")
+
+
+# -------------------- SOLVED TABLE --------------------
+# (x, o) -> ((move, score), ...) for the side to move; score > 0 wins, < 0 loses,
+# larger magnitude = sooner. Terminal positions map to an empty tuple.
+Table = Dict[Tuple[int, int], Tuple[Tuple[int, int], ...]]
+
+# Published only once complete, so readers never see a half-built table
+_TABLE: Optional[Table] = None
+_table_lock = threading.Lock()
+
+
+def _solve(x: int, o: int, moves_by_key: Table, values: Dict[Tuple[int, int], int]) -> int:
+    key = (x, o)
+    value = values.get(key)
+    if value is not None:
+        return value
+    mover_is_x = x_to_move(x, o)
+    free = empty_squares(x, o)
+    if has_line(o if mover_is_x else x):
+        moves, value = (), -(1 + len(free))  # the previous move won
+    elif not free:
+        moves, value = (), 0
+    else:
+        scored = []
+        for m in free:
+            bit = 1 << m
+            child = _solve(x | bit, o, moves_by_key, values) if mover_is_x else _solve(x, o | bit, moves_by_key, values)
+            scored.append((m, -child))
+        moves = tuple(scored)
+        value = max(score for _, score in scored)
+    moves_by_key[key] = moves
+    values[key] = value
+    return value
+
+
+def table() -> Table:
+    """The solved table, built on first use (a few milliseconds)"""
+    global _TABLE
+    if _TABLE is None:
+        with _table_lock:
+            if _TABLE is None:
+                built: Table = {}
+                _solve(0, 0, built, {})
+                _TABLE = built
+    return _TABLE
+
+
+# -------------------- PLAY --------------------
+def best_moves(x: int, o: int) -> List[int]:
+    moves = table()[(x, o)]
+    if not moves:
+        return []
+    top = max(score for _, score in moves)
+    return [m for m, score in moves if score == top]
+
+
+def choose_move(x: int, o: int, level: str = DEFAULT_LEVEL) -> Optional[int]:
+    """Move for the side to play, at the given difficulty"""
+    moves = table()[(x, o)]
+    if not moves:
+        return None
+    if random.random() < LEVELS.get(level, LEVELS[DEFAULT_LEVEL]):
+        return random.choice(best_moves(x, o))
+    return random.choice([m for m, _ in moves])
+
+
+def cells(x: int, o: int) -> List[str]:
+    """Board as the 9-item " "/"X"/"O" list used for rendering"""
+    return ["X" if x >> i & 1 else "O" if o >> i & 1 else " " for i in range(9)]
@@ -0,0 +1,164 @@
+"""
+Streaming stage for uploaded images.
+By the time this runs the multipart parser has already stored the file:
+Starlette spools parts over 1 MB to a temporary file and Werkzeug does the
+same above ~500 KB, so large uploads do touch disk. The request-size caps
+in the adapters stop that spool at MAX_REQUEST_BYTES. Here the stored file
+is read back in chunks, and each chunk is size-checked, hashed,
+type-sniffed and fed to Pillow's incremental parser. The chunks accumulate
+in one bytearray that becomes Upload.data without another copy, so an
+accepted image is held in memory once.
+"""
+import os
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Optional
+
+from axon_core.metrics import METRICS
+from axon_core.upstream import ImageFile
+
+UPLOAD_MAX_BYTES = int(os.getenv("UPLOAD_MAX_BYTES", 10 * 1024 * 1024))
+UPLOAD_MAX_PIXELS = int(os.getenv("UPLOAD_MAX_PIXELS", 40_000_000))
+UPLOAD_CHUNK_BYTES = 64 * 1024
+# Question text and multipart boundaries on top of the file itself
+FORM_OVERHEAD_BYTES = 64 * 1024
+MAX_REQUEST_BYTES = UPLOAD_MAX_BYTES + FORM_OVERHEAD_BYTES
+
+SNIFF_BYTES = 12
+
+
+class UploadTooLarge(Exception):
+    """Upload over the byte or pixel cap; surfaced to clients as a 413"""
+
+    def __init__(self, message: str = ""):
+        self.message = message or f"Image too large. The limit is {UPLOAD_MAX_BYTES / (1024 * 1024):.3g} MB. 🛰️"
+        super().__init__(self.message)
+
+
+def sniff_image_type(head: bytes) -> Optional[str]:
+    """Media type from the file signature (PNG, JPEG, WebP), regardless of its name"""
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if head.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
+@dataclass
+class Upload:
+    filename: str
+    data: bytearray            # the reader's buffer, handed over rather than copied
+    sha256: str
+    mime_type: Optional[str]   # None when the content isn't a supported image
+    image: Any = None          # decoded PIL image (None when undecodable)
+
+    @property
+    def size(self) -> int:
+        return len(self.data)
+
+
+class UploadReader:
+    """Incremental size check, hash, type sniff and decode for one upload"""
+
+    def __init__(self, filename: str, max_bytes: int = UPLOAD_MAX_BYTES):
+        self.filename = filename or ""
+        self.max_bytes = max_bytes
+        self.mime_type: Optional[str] = None
+        self._buffer = bytearray()
+        self._hash = hashlib.sha256()
+        self._parser = None
+        self._sniffed = False
+
+    def _sniff(self) -> None:
+        self._sniffed = True
+        self.mime_type = sniff_image_type(bytes(self._buffer[:SNIFF_BYTES]))
+        if self.mime_type:
+            self._parser = ImageFile.Parser()
+            self._decode(bytes(self._buffer))
+
+    def _decode(self, chunk: bytes) -> None:
+        try:
+            self._parser.feed(chunk)
+        except Exception as e:
+            print(f"Upload Decode Error ({self.filename[:40]}): {e}")
+            self._parser = None
+            return
+        image = self._parser.image
+        if image is not None and image.size[0] * image.size[1] > UPLOAD_MAX_PIXELS:
+            raise UploadTooLarge(f"Image dimensions too large ({image.size[0]}x{image.size[1]}). 🛰️")
+
+    def feed(self, chunk: bytes) -> None:
+        if len(self._buffer) + len(chunk) > self.max_bytes:
+            raise UploadTooLarge()
+        self._hash.update(chunk)
+        self._buffer += chunk
+        if not self._sniffed:
+            if len(self._buffer) >= SNIFF_BYTES:
+                self._sniff()
+        elif self._parser is not None:
+            self._decode(chunk)
+
+    def finish(self) -> Upload:
+        if not self._sniffed:
+            self._sniff()
+        image = None
+        if self._parser is not None:
+            try:
+                image = self._parser.close()
+            except Exception as e:
+                print(f"Upload Decode Error ({self.filename[:40]}): {e}")
+        if self.mime_type and image is None:
+            METRICS.inc("upload.undecodable")
+        return Upload(self.filename, self._buffer, self._hash.hexdigest(), self.mime_type, image)
+
+
+def read_upload(stream: BinaryIO, filename: str, max_bytes: int = UPLOAD_MAX_BYTES) -> Optional[Upload]:
+    """Drain a file-like upload through an UploadReader; None for an empty file field"""
+    start = time.perf_counter()
+    reader = UploadReader(filename, max_bytes)
+    try:
+        while True:
+            chunk = stream.read(UPLOAD_CHUNK_BYTES)
+            if not chunk:
+                break
+            reader.feed(chunk)
+    except UploadTooLarge:
+        METRICS.inc("upload.rejected.too_large")
+        raise
+    upload = reader.finish()
+    if not upload.data:
+        return None
+    METRICS.inc("upload.bytes", upload.size)
+    METRICS.set_gauge("upload.last_read_ms", round((time.perf_counter() - start) * 1000, 2))
+    return upload
+
+
+class UploadAnalysisCache:
+    """LRU of sha256 -> analysis context, so re-sent images skip OCR and diagnostics"""
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, digest: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is not None:
+                self._entries.move_to_end(digest)
+            return entry
+
+    def put(self, digest: str, entry: str) -> None:
+        with self._lock:
+            self._entries[digest] = entry
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+ANALYSIS_CACHE = UploadAnalysisCache()
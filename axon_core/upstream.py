@@ -0,0 +1,69 @@
+"""
+Upstream dependencies (Groq, DuckDuckGo, Bing, Tesseract) behind lazy
+imports, circuit breakers, stage limiters and the LLM scheduler.
+"""
+import os
+from typing import AsyncIterator, Optional
+
+from dotenv import load_dotenv
+
+from axon_core.admission import STAGES
+from axon_core.breaker import get_breaker
+from axon_core.lazy import LazyObject, lazy_attr, lazy_import, module_available
+from axon_core.scheduler import LLM_SCHEDULER
+
+load_dotenv()
+
+GROQ_API_KEY = os.getenv("GROQ_API_KEY")
+# Routes report a missing key to the user instead of failing inside the Groq client
+GROQ_CONFIGURED = bool(GROQ_API_KEY)
+TESSERACT_PATH = os.getenv("TESSERACT_PATH", "tesseract")
+
+# Heavy dependencies load on first use to keep (serverless) cold starts fast
+Image = lazy_import("PIL.Image")
+ImageFile = lazy_import("PIL.ImageFile")
+pytesseract = lazy_import("pytesseract", on_load=lambda m: setattr(m.pytesseract, "tesseract_cmd", TESSERACT_PATH))
+DDGS = lazy_attr("duckduckgo_search", "DDGS")
+AsyncGroq = lazy_attr("groq", "AsyncGroq")
+httpx = lazy_import("httpx")
+httpcore = lazy_import("httpcore")
+BeautifulSoup = lazy_attr("bs4", "BeautifulSoup")
+cv2 = lazy_import("cv2")
+np = lazy_import("numpy")
+# CV2 and NumPy are optional (technical analysis only)
+CV_AVAILABLE = module_available("cv2") and module_available("numpy")
+
+# Groq API Gateway for the async engine; one per process, bound to the serving event loop
+async_client = LazyObject(lambda: AsyncGroq(api_key=GROQ_API_KEY)) if GROQ_CONFIGURED else None
+
+# Upstream Circuit Breakers (fail fast while a dependency is down)
+GROQ_BREAKER = get_breaker("groq")
+DDGS_BREAKER = get_breaker("ddgs")
+BING_BREAKER = get_breaker("bing")
+TESSERACT_BREAKER = get_breaker("tesseract")
+
+# Global concurrency caps for the expensive pipeline stages
+LLM_STAGE = STAGES["llm"]
+OCR_STAGE = STAGES["ocr"]
+IMAGE_SEARCH_STAGE = STAGES["image_search"]
+
+
+async def _acreate(**kwargs):
+    with GROQ_BREAKER:
+        return await async_client.chat.completions.create(**kwargs)
+
+
+async def agroq_chat(priority: int, deadline: Optional[float] = None, **kwargs):
+    """Non-blocking chat completion; the scheduler queue wait is a future on this loop"""
+    return await LLM_SCHEDULER.arun(priority, _acreate, deadline=deadline, **kwargs)
+
+
+async def agroq_stream(priority: int, deadline: Optional[float] = None, **kwargs) -> AsyncIterator[str]:
+    """Streamed chat completion yielding content deltas; holds one scheduler slot until drained"""
+    async with LLM_SCHEDULER.aslot(priority, deadline):
+        with GROQ_BREAKER:
+            stream = await async_client.chat.completions.create(stream=True, **kwargs)
+            async for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    yield delta
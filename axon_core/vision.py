@@ -0,0 +1,68 @@
+"""Uploaded-image analysis: OCR, technical diagnostics and vision encoding"""
+import base64
+
+from axon_core.upstream import CV_AVAILABLE, TESSERACT_BREAKER, cv2, np, pytesseract
+
+OCR_FALLBACK = "[Scanning image for visual features and metadata...]"
+
+
+def extract_text_from_image(image) -> str:
+    """Extract readable text from a decoded image using OCR with graceful fallbacks"""
+    if image is None or TESSERACT_BREAKER.is_open():
+        return OCR_FALLBACK
+    try:
+        text = TESSERACT_BREAKER.call(pytesseract.image_to_string, image.convert('RGB'))
+        if text.strip():
+            return f"[Visual Scan Content: {text.strip()}]"
+    except Exception as e:
+        print(f"OCR Error: {e}")
+
+    return OCR_FALLBACK
+
+
+class TechnicalImageAnalyzer:
+    """Analyzes physical and technical properties of a decoded image using CV2 and NumPy"""
+    def __init__(self, image, size_bytes: int):
+        self.size_bytes = size_bytes
+        self.valid = False
+        if image is None or not CV_AVAILABLE:
+            return
+
+        try:
+            self.width, self.height = image.size
+            # The upload is already decoded; grayscale is all the diagnostics need
+            self.gray = np.asarray(image.convert('L'))
+            self.valid = True
+        except Exception as e:
+            print(f"Technical Analysis Init Error: {e}")
+
+    def get_analysis_summary(self) -> str:
+        if not self.valid:
+            return ""
+
+        try:
+            # Basic Metadata
+            filesize = round(self.size_bytes / 1024, 2)
+
+            # Brightness & Lighting
+            gray = self.gray
+            avg_brightness = np.mean(gray)
+            lighting = "Low-Light/Dark" if avg_brightness < 80 else "Bright/Well-Lit"
+            if 80 <= avg_brightness <= 180: lighting = "Balanced"
+
+            # Visual Complexity (Edge Density)
+            edges = cv2.Canny(gray, 100, 200)
+            edge_density = (np.sum(edges > 0) / edges.size) * 100
+            complexity = "High (Highly Detailed/Textured)" if edge_density > 5 else "Low (Simple/Minimalist)"
+
+            return (f"[Technical Diagnostics: Resolution={self.width}x{self.height}, Size={filesize}KB, "
+                    f"Lighting={lighting} (Score: {round(avg_brightness,1)}), "
+                    f"Complexity={complexity} (EdgeDensity: {round(edge_density,2)}%)]")
+        except Exception as e:
+            print(f"Technical Analysis execution Error: {e}")
+            return ""
+
+
+def encode_image(data: bytes) -> str:
+    """Encode image bytes to base64 for vision models"""
+    return base64.b64encode(data).decode('utf-8')
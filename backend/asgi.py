@@ -0,0 +1,89 @@
+"""
+AXON AI - Async Backend (ASGI)
+Same /api/chat contract as server.py, served from an event loop so slow
+Groq calls wait on sockets instead of pinning a worker thread.
+
+    uvicorn asgi:app --port 5000                    # development
+    gunicorn -c gunicorn.conf.py asgi:app           # production (from backend/)
+"""
+import os
+import sys
+from typing import Optional
+
+from dotenv import load_dotenv
+from fastapi import FastAPI, Request, Form, File, UploadFile
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+
+# Shared neural core lives at the project root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from axon_core.adapters.fastapi import (
+    ask_request, install_identity_and_admission, install_upload_limit, register_routes, to_response, to_stream_response,
+)
+from axon_core.engine import PROFILES, AxonEngine
+from axon_core.identity import SessionIdentity
+from axon_core.lazy import maybe_prewarm
+from axon_core.metrics import METRICS
+
+# Load configuration
+load_dotenv()
+
+app = FastAPI(title="Axon AI Backend", debug=os.getenv("AXON_DEBUG", "0") == "1")
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+# Same secret as server.py so session cookies survive switching serving modes
+IDENTITY = SessionIdentity(os.getenv("FLASK_SECRET_KEY", "fallback_yash_axon_77"))
+install_identity_and_admission(app, IDENTITY)
+
+# Upload Limit (oversized bodies get a 413 before the multipart parser buffers them)
+install_upload_limit(app)
+
+# Shared Neural Engine (memory, games, search, vision and chat pipeline)
+ENGINE = AxonEngine(PROFILES["backend"])
+
+# -------------------- ROUTES (API) --------------------
+@app.get("/")
+async def index():
+    return JSONResponse(content={
+        "status": "Axon AI Backend Online",
+        "version": "5.0.0",
+        "api_endpoint": "/api/chat",
+        "instructions": "Visit the frontend on port 3000 to use the chat interface."
+    })
+
+@app.get("/metrics")
+async def metrics():
+    return JSONResponse(content=METRICS.snapshot())
+
+@app.post("/api/chat")
+async def chat(
+    request: Request,
+    question: Optional[str] = Form(None),
+    image: Optional[UploadFile] = File(None)
+):
+    reply = await ENGINE.ask(await ask_request(request, question, image))
+    return to_response(reply)
+
+@app.post("/api/chat/stream")
+async def chat_stream(
+    request: Request,
+    question: Optional[str] = Form(None),
+    image: Optional[UploadFile] = File(None)
+):
+    """Same contract as /api/chat, streamed as NDJSON token deltas plus a final "done" event"""
+    return await to_stream_response(ENGINE.ask_stream(await ask_request(request, question, image)))
+
+# Shared routes: /api/prefetch, /api/img-batch, /api/img-proxy
+register_routes(app, ENGINE, prefix="/api")
+
+maybe_prewarm()
+
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run("asgi:app", host="0.0.0.0", port=int(os.environ.get("PORT", 5000)), log_level="info")
@@ -0,0 +1,17 @@
+"""Production server config for the async backend: gunicorn -c gunicorn.conf.py asgi:app"""
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', 5000)}"
+worker_class = "uvicorn.workers.UvicornWorker"
+# Conversation memory, game state, prefetch results and the rate-limit buckets
+# all live in process, so a user's turns must keep landing on the same worker.
+# One event loop already multiplexes many slow Groq calls; don't raise this
+# without moving that state into a shared store. Workers are not recycled
+# (no max_requests) for the same reason: a restart wipes every conversation.
+workers = int(os.getenv("WEB_CONCURRENCY", 1))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", 120))
+graceful_timeout = 30
+keepalive = 5
+accesslog = "-"
+errorlog = "-"
+loglevel = os.getenv("LOG_LEVEL", "info")
@@ -0,0 +1,85 @@
+"""
+AXON AI - Bing Extraction Benchmark
+Compares the full BeautifulSoup parse of a Bing image results page with the
+streaming BingImageExtractor, fed in 16 KB chunks like the live download.
+
+    python benchmarks/bing_extract.py                         # synthetic page
+    python benchmarks/bing_extract.py --fixture saved.html    # saved result pages
+"""
+import os
+import sys
+import html
+import json
+import time
+import argparse
+import statistics
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from axon_core.search import BING_MAX_RESULTS, BingImageExtractor, _parse_bing  # noqa: E402
+
+CHUNK = 16384
+
+
+def synthetic_page(results: int = 150) -> str:
+    """Roughly the shape and size of a live results page (~200 KB)"""
+    filler = "<div class=\"imgpt\"><div class=\"img_cont hoff\"><img class=\"mimg\" src=\"data:image/gif;base64,R0lGODlhAQABAIAAAAAAAP\" /></div></div>" * 4
+    items = []
+    for i in range(results):
+        meta = {
+            "cid": f"c{i:04d}", "purl": f"https://example.org/page/{i}",
+            "murl": f"https://images.example.org/full/{i}/photo-{i}.jpg?w=1920&h=1080",
+            "turl": f"https://tse1.mm.bing.net/th?id=OIP.{i:08d}", "md5": f"{i:032x}",
+            "t": f"Result {i} title", "desc": "A fairly long description " * 6,
+        }
+        m = html.escape(json.dumps(meta), quote=True)
+        items.append(f"<li><div class=\"iuscp\"><a class=\"iusc\" style=\"height:180px\" m=\"{m}\" href=\"/images/search?view=detailV2&id={i}\">{filler}</a></div></li>")
+    head = "<html><head><script>" + "var _w=window;" * 2000 + "</script></head><body><ul class=\"dgControl_list\">"
+    return head + "".join(items) + "</ul></body></html>"
+
+
+def chunks(page: str):
+    for i in range(0, len(page), CHUNK):
+        yield page[i:i + CHUNK]
+
+
+def best_ms(fn, runs: int):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return min(times), statistics.median(times)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixture", action="append", help="saved Bing results page (repeatable)")
+    parser.add_argument("--limit", type=int, default=BING_MAX_RESULTS)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    pages = [("synthetic", synthetic_page())]
+    for path in args.fixture or []:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            pages.append((os.path.basename(path), f.read()))
+
+    for name, page in pages:
+        full = _parse_bing(page)
+        fast = BingImageExtractor.extract(chunks(page), args.limit)
+        if fast != full[:len(fast)]:
+            print(f"[{name}] MISMATCH: extractor disagrees with the BeautifulSoup parse")
+            return 1
+        soup_ms, soup_med = best_ms(lambda: _parse_bing(page), args.runs)
+        fast_ms, fast_med = best_ms(lambda: BingImageExtractor.extract(chunks(page), args.limit), args.runs)
+        all_ms, all_med = best_ms(lambda: BingImageExtractor.extract(chunks(page), len(full) or 1), args.runs)
+        print(f"[{name}] {len(page) / 1024:.0f} KB, {len(full)} results")
+        print(f"    BeautifulSoup (full tree)    {soup_ms:8.2f} ms  (median {soup_med:.2f})")
+        print(f"    extractor, all results       {all_ms:8.2f} ms  (median {all_med:.2f})  x{soup_ms / all_ms:.0f}")
+        print(f"    extractor, first {args.limit:<3d}         {fast_ms:8.2f} ms  (median {fast_med:.2f})  x{soup_ms / fast_ms:.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+"""
+AXON AI - Circuit Breaker Check
+Drives a breaker through open -> half-open, cancels the half-open probe
+mid-flight (a client disconnecting during a streamed reply) and checks the
+slot is handed back instead of wedging the breaker. Exits non-zero on a
+failed check.
+
+    python benchmarks/breaker_check.py
+"""
+import os
+import sys
+import time
+import asyncio
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from axon_core.breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker  # noqa: E402
+
+
+async def cancelled_probe(breaker: CircuitBreaker) -> None:
+    async def probe():
+        with breaker:
+            await asyncio.sleep(1)
+
+    task = asyncio.ensure_future(probe())
+    await asyncio.sleep(0)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+def main() -> int:
+    breaker = CircuitBreaker("breaker_check", failure_threshold=1, recovery_seconds=0.01)
+    failures = []
+
+    def check(ok: bool, what: str) -> None:
+        print(f"  {'ok  ' if ok else 'FAIL'} {what}")
+        if not ok:
+            failures.append(what)
+
+    try:
+        breaker.call(lambda: 1 / 0)
+    except ZeroDivisionError:
+        pass
+    check(breaker.state == OPEN and not breaker.allow(), "one failure opens the breaker and it refuses calls")
+
+    time.sleep(0.02)
+    asyncio.run(cancelled_probe(breaker))
+    check(breaker.state == HALF_OPEN, f"a cancelled probe leaves it half-open (got {breaker.state})")
+    check(breaker.allow(), "a cancelled probe hands back the half-open slot")
+
+    breaker.record_success()
+    check(breaker.state == CLOSED, "a successful probe closes it")
+
+    print("breaker check ok" if not failures else f"breaker check FAILED ({len(failures)})")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
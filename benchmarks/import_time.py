@@ -0,0 +1,100 @@
+"""
+AXON AI - Cold Start Benchmark
+Measures server import time with `python -X importtime` and fails when it
+regresses past a budget. Interpreter startup (site, encodings) is reported
+separately and doesn't count against the budget; the heaviest direct
+imports of the server module and the heaviest modules by self time are
+listed underneath.
+
+    python benchmarks/import_time.py                      # all three servers
+    python benchmarks/import_time.py --target main --budget-ms 600
+"""
+import os
+import re
+import sys
+import argparse
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# name -> (working directory, module to import)
+TARGETS = {
+    "main": (ROOT, "main"),
+    "app": (ROOT, "app"),
+    "backend": (os.path.join(ROOT, "backend"), "server"),
+    "backend-asgi": (os.path.join(ROOT, "backend"), "asgi"),
+}
+
+DEFAULT_BUDGET_MS = float(os.getenv("IMPORT_BUDGET_MS", 1500))
+
+LINE_RE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def measure(cwd: str, module: str):
+    """
+    One cold import of `module`. Returns (import_ms, startup_ms, children,
+    by_self): the target's own cumulative time, the interpreter startup
+    imports that ran before it (site, encodings, ...), its direct children
+    as [(cumulative_us, name)] and every module under it as [(self_us, name)].
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=cwd, capture_output=True, text=True,
+        env={**os.environ, "AXON_PREWARM": "0"},
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr.strip().splitlines()[-1]}")
+    entries = []
+    for line in proc.stderr.splitlines():
+        m = LINE_RE.match(line)
+        if m:
+            # One space before a top-level name, two more per nesting level
+            depth = (len(m.group(3)) - 1) // 2
+            entries.append((int(m.group(1)), int(m.group(2)), depth, m.group(4)))
+    # A module is reported after everything it imports, so the target's
+    # subtree is the run of nested entries right before its own line
+    target = max(i for i, (_, _, depth, name) in enumerate(entries) if depth == 0 and name == module)
+    first = target
+    while first > 0 and entries[first - 1][2] > 0:
+        first -= 1
+    subtree = entries[first:target + 1]
+    startup_us = sum(cumulative for i, (_, cumulative, depth, _) in enumerate(entries) if depth == 0 and i != target)
+    children = sorted(((cumulative, name) for _, cumulative, depth, name in subtree if depth == 1), reverse=True)
+    by_self = sorted(((self_us, name) for self_us, _, _, name in subtree), reverse=True)
+    return entries[target][1] / 1000, startup_us / 1000, children, by_self
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", choices=sorted(TARGETS), action="append")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=3, help="best-of-N to smooth out noise")
+    parser.add_argument("--top", type=int, default=8, help="heaviest imports to list (per table)")
+    args = parser.parse_args()
+
+    failed = False
+    for name in args.target or sorted(TARGETS):
+        cwd, module = TARGETS[name]
+        try:
+            best_ms, startup_ms, children, by_self = min(
+                (measure(cwd, module) for _ in range(args.runs)), key=lambda r: r[0],
+            )
+        except RuntimeError as e:
+            print(f"[{name}] ERROR {e}")
+            failed = True
+            continue
+        status = "OK" if best_ms <= args.budget_ms else "OVER BUDGET"
+        print(f"[{name}] import {module}: {best_ms:.1f} ms (budget {args.budget_ms:.0f} ms) {status}; "
+              f"interpreter startup {startup_ms:.1f} ms")
+        print("  direct imports (cumulative):")
+        for cumulative, mod in children[:args.top]:
+            print(f"    {cumulative / 1000:8.1f} ms  {mod}")
+        print("  heaviest modules (self):")
+        for self_us, mod in by_self[:args.top]:
+            print(f"    {self_us / 1000:8.1f} ms  {mod}")
+        failed |= best_ms > args.budget_ms
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
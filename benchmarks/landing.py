@@ -0,0 +1,132 @@
+"""
+AXON AI - Landing Page Benchmark
+In-process GET / throughput for the template frontends, comparing the
+previous handlers (Jinja render per hit, plus a memory reset/ensure and a
+new session for every cookieless visitor) with the pre-rendered, sessionless
+route. No sockets are involved, so the numbers are per-request server cost.
+
+    python benchmarks/landing.py
+    python benchmarks/landing.py --requests 5000
+"""
+import os
+import sys
+import time
+import asyncio
+import argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+import httpx  # noqa: E402
+from fastapi import FastAPI, Request  # noqa: E402
+from fastapi.responses import HTMLResponse  # noqa: E402
+from fastapi.templating import Jinja2Templates  # noqa: E402
+from flask import Flask, render_template  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+
+import app as flask_main  # noqa: E402
+import main as fastapi_main  # noqa: E402
+from axon_core.adapters.flask import install_identity  # noqa: E402
+from axon_core.identity import SESSION_COOKIE, SessionIdentity, cookie_kwargs  # noqa: E402
+
+
+def legacy_fastapi() -> FastAPI:
+    """GET / as it was: session middleware, memory reset and a Jinja render per hit"""
+    app = FastAPI()
+    identity = SessionIdentity("benchmark")
+
+    async def admission_control(request: Request, call_next):
+        return await call_next(request)  # GET / was never rate limited; the layer still ran
+
+    async def session_identity(request: Request, call_next):
+        sid, is_new = identity.resolve(request.cookies.get(SESSION_COOKIE))
+        request.state.user_id = sid
+        response = await call_next(request)
+        if is_new:
+            response.set_cookie(SESSION_COOKIE, identity.cookie_value(sid), **cookie_kwargs())
+        return response
+
+    app.add_middleware(BaseHTTPMiddleware, dispatch=admission_control)
+    app.add_middleware(BaseHTTPMiddleware, dispatch=session_identity)
+    templates = Jinja2Templates(directory=os.path.join(ROOT, "templates"))
+
+    @app.get("/", response_class=HTMLResponse)
+    async def home(request: Request):
+        fastapi_main.ENGINE.reset(request.state.user_id)
+        return templates.TemplateResponse(request, "index.html")
+
+    return app
+
+
+def legacy_flask() -> Flask:
+    app = Flask("legacy", template_folder=os.path.join(ROOT, "templates"))
+    current_user_id = install_identity(app, SessionIdentity("benchmark"))
+
+    @app.route("/")
+    def home():
+        flask_main.ENGINE.ensure(current_user_id())
+        return render_template("index.html")
+
+    return app
+
+
+async def asgi_rps(app, requests: int, cookie: bool) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+        headers = {"accept-encoding": "gzip"}
+        if cookie:
+            first = await http.get("/")
+            http.cookies.clear()
+            sid = first.cookies.get(SESSION_COOKIE) or (await http.post("/ask", data={"question": "hi"})).cookies.get(SESSION_COOKIE)
+            headers["cookie"] = f"{SESSION_COOKIE}={sid}"
+        start = time.perf_counter()
+        for _ in range(requests):
+            response = await http.get("/", headers=headers)
+            http.cookies.clear()
+            assert response.status_code == 200, response.status_code
+        return requests / (time.perf_counter() - start)
+
+
+def wsgi_rps(app, requests: int) -> float:
+    client = app.test_client(use_cookies=False)
+    start = time.perf_counter()
+    for _ in range(requests):
+        response = client.get("/", headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200, response.status_code
+    return requests / (time.perf_counter() - start)
+
+
+def report(label: str, before: float, after: float, sessions_before: int, sessions_after: int) -> None:
+    print(f"[{label}]")
+    print(f"    before  {before:9.0f} req/s   sessions created: {sessions_before}")
+    print(f"    after   {after:9.0f} req/s   sessions created: {sessions_after}   x{after / before:.1f}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+    n = args.requests
+
+    memory = fastapi_main.ENGINE.memory
+    for cookie, label in ((False, "FastAPI main.py, cookieless (crawlers)"), (True, "FastAPI main.py, returning user")):
+        asyncio.run(asgi_rps(fastapi_main.app, 20, cookie))  # warm the page cache and imports
+        start = len(memory)
+        before = asyncio.run(asgi_rps(legacy_fastapi(), n, cookie))
+        created_before, start = len(memory) - start, len(memory)
+        after = asyncio.run(asgi_rps(fastapi_main.app, n, cookie))
+        report(label, before, after, created_before, len(memory) - start)
+
+    memory = flask_main.ENGINE.memory
+    wsgi_rps(flask_main.app, 20)
+    start = len(memory)
+    before = wsgi_rps(legacy_flask(), n)
+    created_before, start = len(memory) - start, len(memory)
+    after = wsgi_rps(flask_main.app, n)
+    report("Flask app.py, cookieless (crawlers)", before, after, created_before, len(memory) - start)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
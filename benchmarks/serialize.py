@@ -0,0 +1,90 @@
+"""
+AXON AI - Response Serialization Benchmark
+Per-request cost of encoding representative chat response bodies with the
+previous framework defaults (Flask jsonify / FastAPI JSONResponse), each
+available serializer backend, and a pre-encoded RawJSON body.
+
+    python benchmarks/serialize.py
+    python benchmarks/serialize.py --runs 20000
+"""
+import os
+import sys
+import json
+import time
+import argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from axon_core import fragments  # noqa: E402
+from axon_core.lazy import module_available  # noqa: E402
+from axon_core.responses import CREATOR_INFO, HELP_MESSAGE  # noqa: E402
+from axon_core.serializer import OrjsonSerializer, RawJSON, StdlibSerializer  # noqa: E402
+
+
+def payloads():
+    """(name, payload) pairs shaped like real replies"""
+    answer = (
+        "## Neural Analysis 🧠\n\nHere is a detailed breakdown of the topic, with **formatting**, "
+        "`inline code`, links to [sources](https://example.org/a?b=c&d=e) and <em>HTML</em> fragments — "
+        "plus “smart quotes” and emoji ✨🚀.\n\n"
+    ) * 40
+    board = fragments.board(0b000010001, 0b100000010)
+    return [
+        ("/help (canned)", {"message": HELP_MESSAGE}),
+        ("creator info (canned)", {"message": CREATOR_INFO}),
+        ("tic-tac-toe move", {"message": f"My move! Board updated:<br><br>{board}<br>Your turn! Enter a position (**1-9**)."}),
+        (f"assistant answer ({len(answer) // 1024} KB)", {"message": answer}),
+        ("image batch (8)", {"results": [
+            {"subject": f"subject {i}", "image": f"/img-proxy?u=aHR0cHM6Ly9pbWFnZXMuZXhhbXBsZS5vcmcv{i}&s=sig{i}",
+             "description": "A short one-line description of the subject."}
+            for i in range(8)
+        ]}),
+    ]
+
+
+def encoders():
+    yield "jsonify (sorted, ASCII)", lambda p: json.dumps(p, sort_keys=True).encode("utf-8")
+    yield "JSONResponse (stdlib)", lambda p: json.dumps(p, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    yield "serializer: stdlib", StdlibSerializer().dumps
+    if module_available("orjson"):
+        yield "serializer: orjson", OrjsonSerializer().dumps
+
+
+def per_call_us(fn, arg, runs: int) -> float:
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(runs):
+            fn(arg)
+        best = min(best, (time.perf_counter() - start) / runs)
+    return best * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5000)
+    args = parser.parse_args()
+
+    if not module_available("orjson"):
+        print("orjson is not installed; only the stdlib backend is measured\n")
+
+    for name, payload in payloads():
+        reference = json.loads(json.dumps(payload))
+        raw = RawJSON(StdlibSerializer().dumps(payload))
+        print(f"[{name}] {len(raw) / 1024:.1f} KB encoded")
+        baseline = None
+        for label, encode in encoders():
+            if json.loads(encode(payload)) != reference:
+                print(f"    {label}: MISMATCH")
+                return 1
+            us = per_call_us(encode, payload, args.runs)
+            baseline = baseline or us
+            print(f"    {label:<26s} {us:9.2f} us/request  x{baseline / us:.1f}")
+        us = per_call_us(StdlibSerializer().dumps, raw, args.runs)
+        print(f"    {'pre-encoded RawJSON':<26s} {us:9.2f} us/request  x{baseline / us:.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
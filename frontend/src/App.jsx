@@ -202,6 +202,58 @@ const Message = ({ msg, voiceEnabled }) => {
   );
 };
 
+// -------------------- NEURAL LINK CLIENT --------------------
+
+const CHAT_URL = '/_/backend/api/chat';
+const STREAM_URL = '/_/backend/api/chat/stream';
+const PREFETCH_URL = '/_/backend/api/prefetch';
+const PREFETCH_DELAY_MS = 400;
+
+// Thrown when the streaming route can't be used, so the caller retries on the JSON route
+class StreamUnavailable extends Error {}
+
+// POSTs to the NDJSON route and calls onDelta for each token chunk.
+// Resolves with the final payload ({ message, images, ... }), same shape as the JSON route.
+const streamChat = async (formData, onDelta) => {
+  if (!window.ReadableStream || !window.TextDecoder) throw new StreamUnavailable();
+
+  let res;
+  try {
+    res = await fetch(STREAM_URL, { method: 'POST', body: formData, credentials: 'same-origin' });
+  } catch (err) {
+    throw new StreamUnavailable(err.message);
+  }
+  if (res.status === 404 || res.status === 405) throw new StreamUnavailable(`HTTP ${res.status}`);
+
+  // Commands, games and errors come back as a single JSON body
+  if (!(res.headers.get('content-type') || '').includes('application/x-ndjson')) {
+    const data = await res.json();
+    if (!res.ok) throw Object.assign(new Error(data.message), { response: { status: res.status, data } });
+    return data;
+  }
+
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  let final = null;
+  for (;;) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    let nl;
+    while ((nl = buffer.indexOf('\n')) >= 0) {
+      const line = buffer.slice(0, nl).trim();
+      buffer = buffer.slice(nl + 1);
+      if (!line) continue;
+      const event = JSON.parse(line);
+      if (event.type === 'delta') onDelta(event.content);
+      else if (event.type === 'done') final = event;
+    }
+  }
+  if (!final) throw new Error('Neural stream closed before completion');
+  return final;
+};
+
 // -------------------- MAIN APP COMPONENT --------------------
 
 const App = () => {
@@ -211,6 +263,7 @@ const App = () => {
   ]);
   const [input, setInput] = useState('');
   const [loading, setLoading] = useState(false);
+  const [streaming, setStreaming] = useState(false);
   const [mode, setMode] = useState('nexus');
   const [selectedImage, setSelectedImage] = useState(null);
   const [previewUrl, setPreviewUrl] = useState('');
@@ -218,6 +271,8 @@ const App = () => {
   const [isListening, setIsListening] = useState(false);
   const chatEndRef = useRef(null);
   const recognitionRef = useRef(null);
+  const prefetchRef = useRef(null);
+  const lastPrefetchRef = useRef('');
 
   const scrollToBottom = () => chatEndRef.current?.scrollIntoView({ behavior: 'smooth' });
 
@@ -260,7 +315,7 @@ const App = () => {
     setMode('chat');
     window.speechSynthesis.cancel();
     try {
-      await axios.post('/_/backend/api/chat', { question: '/clear' });
+      await axios.post(CHAT_URL, { question: '/clear' });
     } catch (err) {
       console.warn("Server reset fail", err);
     }
@@ -306,6 +361,23 @@ const App = () => {
     window.speechSynthesis.cancel();
   };
 
+  // Speculative live-search prefetch: the debounced draft warms the server's search cache
+  useEffect(() => {
+    const draft = input.trim();
+    if (!draft || draft.startsWith('/') || draft === lastPrefetchRef.current) return undefined;
+    const timer = setTimeout(() => {
+      lastPrefetchRef.current = draft;
+      prefetchRef.current?.abort();
+      const controller = new AbortController();
+      prefetchRef.current = controller;
+      const formData = new FormData();
+      formData.append('question', draft);
+      fetch(PREFETCH_URL, { method: 'POST', body: formData, credentials: 'same-origin', signal: controller.signal })
+        .catch(() => {}); // best-effort; aborted or failed prefetches are ignored
+    }, PREFETCH_DELAY_MS);
+    return () => clearTimeout(timer);
+  }, [input]);
+
   const handleSubmit = async (e, voiceTranscript = null) => {
     if (e) e.preventDefault();
     let currentInput = (voiceTranscript || input).trim();
@@ -321,6 +393,8 @@ const App = () => {
     const userMsg = { role: 'user', content: voiceTranscript || input, imageUrl: previewUrl, timestamp: Date.now() };
     setMessages(prev => [...prev, userMsg]);
     
+    prefetchRef.current?.abort();
+    lastPrefetchRef.current = '';
     setInput('');
     const currentImage = selectedImage;
     setSelectedImage(null);
@@ -331,32 +405,66 @@ const App = () => {
     formData.append('question', currentInput);
     if (currentImage) formData.append('image', currentImage);
 
+    // Token chunks are batched per animation frame to keep re-renders cheap
+    const streamId = `ai-${Date.now()}`;
+    let pending = '';
+    let frame = null;
+    const flush = () => {
+      frame = null;
+      const chunk = pending;
+      pending = '';
+      setStreaming(true);
+      setMessages(prev => prev.some(m => m.id === streamId)
+        ? prev.map(m => m.id === streamId ? { ...m, content: m.content + chunk } : m)
+        : [...prev, { id: streamId, role: 'assistant', content: chunk, timestamp: Date.now() }]);
+    };
+    const onDelta = (delta) => {
+      pending += delta;
+      if (frame === null) frame = requestAnimationFrame(flush);
+    };
+
     try {
-      const response = await axios.post('/_/backend/api/chat', formData, {
-        headers: { 'Content-Type': 'multipart/form-data' }
-      });
+      let data;
+      try {
+        data = await streamChat(formData, onDelta);
+      } catch (err) {
+        if (!(err instanceof StreamUnavailable)) throw err;
+        const response = await axios.post(CHAT_URL, formData, {
+          headers: { 'Content-Type': 'multipart/form-data' }
+        });
+        data = response.data;
+      }
+      if (frame !== null) cancelAnimationFrame(frame);
 
       const aiMsg = { 
+        id: streamId,
         role: 'assistant', 
-        content: response.data.message,
-        images: response.data.images || null,
+        content: data.message,
+        images: data.images || null,
         timestamp: Date.now()
       };
       
-      setMessages(prev => [...prev, aiMsg]);
+      // The final payload is authoritative; it replaces the streamed draft
+      setMessages(prev => prev.some(m => m.id === streamId)
+        ? prev.map(m => m.id === streamId ? aiMsg : m)
+        : [...prev, aiMsg]);
 
       // Simple Text-to-Speech
       if (voiceEnabled) {
-        let speechText = response.data.message.split('Optional Voice Response:')[1] || response.data.message;
+        let speechText = data.message.split('Optional Voice Response:')[1] || data.message;
         speechText = speechText.replace(/<[^>]*>?/gm, ''); // Clean HTML
         const utterance = new SpeechSynthesisUtterance(speechText);
         window.speechSynthesis.speak(utterance);
       }
 
     } catch (error) {
-      setMessages(prev => [...prev, { role: 'assistant', content: 'Neural Link Error: System experienced interference. Please retry.' }]);
+      if (frame !== null) cancelAnimationFrame(frame);
+      // 429s (admission control), 413s (upload too large) and 415s carry a human-readable message
+      const serverMsg = [413, 415, 429].includes(error.response?.status) && error.response.data?.message;
+      setMessages(prev => [...prev, { role: 'assistant', content: serverMsg || 'Neural Link Error: System experienced interference. Please retry.' }]);
     } finally {
       setLoading(false);
+      setStreaming(false);
     }
   };
 
@@ -462,7 +570,7 @@ const App = () => {
             {messages.map((m, i) => (
               <Message key={i} msg={m} voiceEnabled={voiceEnabled} />
             ))}
-            {loading && (
+            {loading && !streaming && (
               <div className="flex gap-4 mb-8">
                 <div className="w-8 h-8 rounded-full bg-indigo-500/20 text-indigo-500 flex items-center justify-center animate-pulse">
                   🧠
@@ -336,6 +336,39 @@ function stopListening() {
     isSystemActive = false;
 }
 
+// --- SPECULATIVE SEARCH PREFETCH ---
+// Sends the draft question (debounced) so live search results are warm by the time it's asked
+const PREFETCH_DELAY_MS = 400;
+let prefetchTimer = null;
+let prefetchController = null;
+let lastPrefetched = "";
+
+function cancelPrefetch() {
+    clearTimeout(prefetchTimer);
+    if (prefetchController) prefetchController.abort();
+    prefetchController = null;
+    lastPrefetched = "";
+}
+
+function schedulePrefetch() {
+    clearTimeout(prefetchTimer);
+    prefetchTimer = setTimeout(async () => {
+        const draft = document.getElementById("question").value.trim();
+        if (isImgMode || draft.startsWith("/") || draft === lastPrefetched) return;
+        lastPrefetched = draft;
+
+        if (prefetchController) prefetchController.abort();
+        prefetchController = new AbortController();
+        const formData = new FormData();
+        formData.append("question", draft);
+        try {
+            await fetch("/prefetch", { method: "POST", body: formData, signal: prefetchController.signal });
+        } catch (e) {
+            // Best-effort: aborted or failed prefetches are simply ignored
+        }
+    }, PREFETCH_DELAY_MS);
+}
+
 async function askAI(fromVoice = false) {
     const input = document.getElementById("question");
     const q = input.value.trim();
@@ -353,6 +386,7 @@ async function askAI(fromVoice = false) {
         finalQuestion = "/img " + q;
     }
 
+    cancelPrefetch();
     addMessage(q, "user", selectedFile);
     input.value = "";
 
@@ -370,7 +404,9 @@ async function askAI(fromVoice = false) {
         const res = await fetch("/ask", { method: "POST", body: formData });
         
         if (!res.ok) {
-            throw new Error(`Server responded with ${res.status}: ${res.statusText}`);
+            // Rejections (413 oversized upload, 429 rate limit) carry a readable message
+            const err = await res.json().catch(() => ({}));
+            throw new Error(err.message || `Server responded with ${res.status}: ${res.statusText}`);
         }
         
         const data = await res.json();
@@ -463,6 +499,7 @@ document.addEventListener("DOMContentLoaded", () => {
     }, 200);
 
     addMessage("Axon system initialized. Neural link established. How can I assist you in your workspace today?", "ai");
+    document.getElementById("question").addEventListener("input", schedulePrefetch);
     document.body.addEventListener('click', () => {
         if (!wakeWordRecognition) {
             const SpeechRecognition = window.SpeechRecognition || window.webkitSpeechRecognition;
@@ -545,6 +582,7 @@ function switchMode(mode) {
     }
 
     if (mode === 'images') {
+        loadImageGallery();
         if (chatBox.innerHTML === "") {
             addMessage("Neural Image Search active. Provide a subject for visual synthesis.", "ai");
         }
@@ -588,11 +626,45 @@ function searchImagesFromSidebar() {
     }
 }
 
+// --- IMAGE GALLERY ---
+// One /img-batch round trip resolves every quick-search card; clicks then render instantly
+const imageGallery = {};
+let galleryRequest = null;
+
+function loadImageGallery() {
+    if (galleryRequest) return galleryRequest;
+    const subjects = [...document.querySelectorAll('#images-section .game-card[data-subject]')].map(card => card.dataset.subject);
+    if (!subjects.length) return Promise.resolve();
+
+    galleryRequest = fetch("/img-batch", {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({ subjects })
+    })
+        .then(res => res.ok ? res.json() : { results: [] })
+        .then(data => {
+            (data.results || []).forEach(r => {
+                if (r.image) imageGallery[r.subject] = r.image;
+            });
+        })
+        .catch(e => {
+            console.warn("Gallery prefetch failed:", e);
+            galleryRequest = null; // allow a retry on the next visit
+        });
+    return galleryRequest;
+}
+
 function quickImageSearch(query) {
-    const chatInput = document.getElementById('question');
-    chatInput.value = query;
-    toggleImgMode(true);
-    askAI();
+    const image = imageGallery[query];
+    if (!image) {
+        const chatInput = document.getElementById('question');
+        chatInput.value = query;
+        toggleImgMode(true);
+        askAI();
+        return;
+    }
+    addMessage(query, "user");
+    addMessage(`<div style='margin:15px 0; overflow:hidden;'><img src='${image}' alt='${query}' style='width:100%; height:auto; display:block; border-radius:20px;' onerror="this.style.display='none';"></div>**Neural Scan:** ${query}`, "ai");
 }
 
 function startGame(gameName) {